@@ -18,6 +18,11 @@ def get_renderer():
     from .renderer import GameRenderer
     return GameRenderer
 
-# For backward compatibility - use functions to avoid immediate imports
-Game = get_game()
-GameRenderer = get_renderer()
\ No newline at end of file
+def __getattr__(name):
+    """Resolve Game and GameRenderer on first access so importing the
+    package (e.g. for tetris.piece) does not pull in pygame."""
+    if name == "Game":
+        return get_game()
+    if name == "GameRenderer":
+        return get_renderer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
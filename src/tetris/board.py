@@ -23,13 +23,33 @@ class Board:
         Returns:
             True if the position is valid, False otherwise
         """
-        for x, y in piece.get_blocks():
+        return self.blocks_fit(piece.get_blocks())
+    
+    def blocks_fit(self, blocks: List[Tuple[int, int]], dx: int = 0, dy: int = 0) -> bool:
+        """Check if block coordinates shifted by (dx, dy) are all free.
+        
+        Lets callers test candidate moves without building a moved Piece.
+        
+        Args:
+            blocks: Absolute (x, y) block coordinates
+            dx: Columns to shift the blocks right before checking
+            dy: Rows to shift the blocks down before checking
+            
+        Returns:
+            True if every shifted block is inside the board and empty
+        """
+        grid = self.grid
+        width = self.width
+        height = self.height
+        for x, y in blocks:
+            x += dx
+            y += dy
             # Check boundaries
-            if x < 0 or x >= self.width or y >= self.height:
+            if x < 0 or x >= width or y >= height:
                 return False
             
             # Check collision with existing blocks (ignore negative y for spawning)
-            if y >= 0 and self.grid[y][x] is not None:
+            if y >= 0 and grid[y][x] is not None:
                 return False
         
         return True
@@ -40,8 +60,8 @@ class Board:
         Args:
             piece: The piece to place
         """
-        for x, y in piece.get_blocks():
-            if 0 <= y < self.height and 0 <= x < self.width:
+        for x, y in piece.visible_blocks():
+            if y < self.height and 0 <= x < self.width:
                 self.grid[y][x] = piece.color
     
     def get_full_lines(self) -> List[int]:
@@ -52,7 +72,7 @@ class Board:
         """
         full_lines = []
         for y in range(self.height):
-            if all(cell is not None for cell in self.grid[y]):
+            if None not in self.grid[y]:
                 full_lines.append(y)
         return full_lines
     
@@ -68,18 +88,17 @@ class Board:
         if not lines:
             return 0
         
-        # Sort lines from top to bottom to avoid index issues
-        lines.sort()
-        
-        # Remove full lines
-        for line in reversed(lines):
-            del self.grid[line]
+        # Keep the surviving rows in one pass rather than deleting and
+        # inserting rows one at a time (each shifts the whole list)
+        cleared = set(lines)
+        kept = [row for y, row in enumerate(self.grid) if y not in cleared]
         
-        # Add new empty lines at the top
-        for _ in range(len(lines)):
-            self.grid.insert(0, [None for _ in range(self.width)])
+        # Add new empty lines at the top; assign in place so the grid list
+        # object stays the same
+        empty_rows = [[None] * self.width for _ in range(self.height - len(kept))]
+        self.grid[:] = empty_rows + kept
         
-        return len(lines)
+        return len(cleared)
     
     def is_game_over(self) -> bool:
         """Check if the game is over (top row has blocks).
@@ -98,10 +117,12 @@ class Board:
         Returns:
             The y position where the piece would land
         """
-        test_piece = piece.copy()
-        while self.is_valid_position(test_piece):
-            test_piece = test_piece.move(0, 1)
-        return test_piece.y - 1
+        # Shift the block coordinates instead of allocating a moved piece per row
+        blocks = piece.get_blocks()
+        dy = 0
+        while self.blocks_fit(blocks, dy=dy):
+            dy += 1
+        return piece.y + dy - 1
     
     def get_ghost_piece(self, piece: Piece) -> Optional[Piece]:
         """Get a ghost piece showing where the current piece would land.
@@ -144,12 +165,17 @@ class Board:
         Returns:
             List of heights for each column
         """
-        heights = []
-        for x in range(self.width):
-            height = 0
-            for y in range(self.height):
-                if self.grid[y][x] is not None:
-                    height = self.height - y
-                    break
-            heights.append(height)
+        width = self.width
+        heights = [0] * width
+        remaining = width
+        # Scan rows top-down once; a column's height comes from its first block
+        for y, row in enumerate(self.grid):
+            if row.count(None) == width:
+                continue
+            for x, cell in enumerate(row):
+                if cell is not None and not heights[x]:
+                    heights[x] = self.height - y
+                    remaining -= 1
+            if not remaining:
+                break
         return heights
\ No newline at end of file
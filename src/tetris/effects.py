@@ -14,6 +14,11 @@ try:
 except ImportError:
     PYGLET_AVAILABLE = False
 
+# 行消除粒子可选的颜色（爆炸色、闪烁色和闪光色）
+_LINE_EFFECT_COLORS = tuple(
+    EFFECT_COLORS['EXPLOSION'] + EFFECT_COLORS['SPARKLE'] + [EFFECT_COLORS['FLASH']]
+)
+
 
 class Particle:
     """高级粒子类 - 支持pyglet风格渲染的混合实现"""
@@ -118,41 +123,39 @@ class LineEffect:
         center_x = BORDER_WIDTH + (board_width * CELL_SIZE) // 2
         center_y = BORDER_WIDTH + row * CELL_SIZE + CELL_SIZE // 2
         
-        for _ in range(20):  # 创建20个粒子增强效果
+        # 一次性抽取所有粒子的随机颜色
+        colors = random.choices(_LINE_EFFECT_COLORS, k=20)
+        
+        # 循环外计算偏移范围并绑定常用函数
+        half_width = board_width * CELL_SIZE // 2
+        quarter_cell = CELL_SIZE // 4
+        uniform = random.uniform
+        cos, sin = math.cos, math.sin
+        two_pi = 2 * math.pi
+        
+        particles = self.particles
+        for color in colors:  # 创建20个粒子增强效果
             # 随机速度和方向
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(80, 200)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            # 随机位置偏移 - 覆盖整行
-            offset_x = random.uniform(-board_width * CELL_SIZE // 2, board_width * CELL_SIZE // 2)
-            offset_y = random.uniform(-CELL_SIZE // 4, CELL_SIZE // 4)
-            
-            # 随机颜色
-            explosion_colors = EFFECT_COLORS['EXPLOSION']
-            sparkle_colors = EFFECT_COLORS['SPARKLE']
-            all_colors = explosion_colors + sparkle_colors + [EFFECT_COLORS['FLASH']]
-            color = random.choice(all_colors)
-            
-            particle = Particle(
-                center_x + offset_x, center_y + offset_y,
-                velocity_x, velocity_y,
-                random.uniform(2.0, 3.0),  # 生命时间 - 延长到2-3秒
+            angle = uniform(0, two_pi)
+            speed = uniform(80, 200)
+            particles.append(Particle(
+                # 随机位置偏移 - 覆盖整行
+                center_x + uniform(-half_width, half_width),
+                center_y + uniform(-quarter_cell, quarter_cell),
+                cos(angle) * speed, sin(angle) * speed,
+                uniform(2.0, 3.0),  # 生命时间 - 延长到2-3秒
                 color,
-                random.uniform(1, 3)  # 大小
-            )
-            self.particles.append(particle)
+                uniform(1, 3)  # 大小
+            ))
         
     def update(self, delta_time):
         """更新效果"""
         self.flash_timer += delta_time
         
-        # 更新所有粒子
-        for particle in self.particles[:]:
+        # 更新所有粒子，然后一次性移除死亡的粒子
+        for particle in self.particles:
             particle.update(delta_time)
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        self.particles = [p for p in self.particles if p.is_alive()]
         
         # Return True if effect is still active
         return (self.flash_timer < self.flash_duration or 
@@ -248,7 +251,9 @@ class EffectsManager:
         """
         # 创建简单的闪烁粒子效果
         particles = []
-        for _ in range(8):  # 创建8个闪烁粒子
+        # 一次性抽取所有粒子的随机颜色
+        colors = random.choices(EFFECT_COLORS['SPARKLE'], k=8)
+        for color in colors:  # 创建8个闪烁粒子
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(30, 80)
             velocity_x = math.cos(angle) * speed
@@ -259,7 +264,7 @@ class EffectsManager:
                 y + random.uniform(-5, 5),
                 velocity_x, velocity_y,
                 random.uniform(0.3, 0.8),  # 生命时间
-                random.choice(EFFECT_COLORS['SPARKLE']),
+                color,
                 random.uniform(1, 2)  # 大小
             )
             particles.append(particle)
@@ -270,10 +275,9 @@ class EffectsManager:
                 self.particles = particles
                 
             def update(self, delta_time):
-                for particle in self.particles[:]:
+                for particle in self.particles:
                     particle.update(delta_time)
-                    if not particle.is_alive():
-                        self.particles.remove(particle)
+                self.particles = [p for p in self.particles if p.is_alive()]
                         
             def is_active(self):
                 return len(self.particles) > 0
@@ -158,9 +158,9 @@ class Game:
         if self.game_over or self.paused:
             return False
         
-        new_piece = self.current_piece.move(dx, dy)
-        if self.board.is_valid_position(new_piece):
-            self.current_piece = new_piece
+        # Check the shifted blocks first; only build the moved piece on success
+        if self.board.blocks_fit(self.current_piece.get_blocks(), dx, dy):
+            self.current_piece = self.current_piece.move(dx, dy)
             return True
         return False
     
@@ -174,17 +174,13 @@ class Game:
             return False
         
         rotated_piece = self.current_piece.rotate()
+        rotated_blocks = rotated_piece.get_blocks()
         
-        # Try basic rotation
-        if self.board.is_valid_position(rotated_piece):
-            self.current_piece = rotated_piece
-            return True
-        
-        # Try wall kicks (simple implementation)
-        for dx in [-1, 1, -2, 2]:
-            kicked_piece = rotated_piece.move(dx, 0)
-            if self.board.is_valid_position(kicked_piece):
-                self.current_piece = kicked_piece
+        # Try basic rotation, then wall kicks (simple implementation);
+        # kicks shift the rotated blocks instead of building a piece per try
+        for dx in (0, -1, 1, -2, 2):
+            if self.board.blocks_fit(rotated_blocks, dx):
+                self.current_piece = rotated_piece.move(dx, 0) if dx else rotated_piece
                 return True
         
         return False
@@ -202,8 +198,11 @@ class Game:
         if self.game_over or self.paused:
             return
         
-        while self.move_piece(0, 1):
-            pass
+        # Find the landing row in one pass instead of stepping row by row
+        piece = self.current_piece
+        drop_y = self.board.get_drop_position(piece)
+        if drop_y > piece.y:
+            self.current_piece = piece.move(0, drop_y - piece.y)
         self.lock_piece()
     
     def lock_piece(self) -> None:
@@ -218,11 +217,11 @@ class Game:
         full_lines = self.board.get_full_lines()
         if full_lines:
             # Create explosion effects for each block in the full lines
+            # Every cell of a full line is filled, so no per-cell check is needed
             for line_y in full_lines:
                 for x in range(self.board.width):
-                    if self.board.grid[line_y][x] is not None:
-                        # Add explosion effect at each block position
-                        self.effects_manager.add_explosion_effect(x, line_y)
+                    # Add explosion effect at each block position
+                    self.effects_manager.add_explosion_effect(x, line_y)
             
             # Clear lines immediately
             lines_cleared = self.board.clear_lines(full_lines)
@@ -102,6 +102,20 @@ class Piece:
         ],
     }
     
+    # Number of distinct rotations per piece type
+    NUM_ROTATIONS: Dict[str, int] = {
+        piece_type: len(shapes) for piece_type, shapes in SHAPES.items()
+    }
+    
+    # (type, rotation index) -> block offsets relative to the piece origin
+    CELLS: Dict[Tuple[str, int], Tuple[Tuple[int, int], ...]] = {
+        (piece_type, rotation): tuple((col, row)
+                                      for row, cells in enumerate(shape)
+                                      for col, filled in enumerate(cells) if filled)
+        for piece_type, shapes in SHAPES.items()
+        for rotation, shape in enumerate(shapes)
+    }
+    
     def __init__(self, piece_type: str = None, x: int = 3, y: int = 0):
         """Initialize a new piece.
         
@@ -122,22 +136,35 @@ class Piece:
     @property
     def shape(self) -> List[List[int]]:
         """Get current shape based on rotation."""
-        shapes = self.SHAPES[self.type]
-        return shapes[self.rotation % len(shapes)]
+        return self.SHAPES[self.type][self.rotation % self.NUM_ROTATIONS[self.type]]
+    
+    def _rel_blocks(self) -> Tuple[Tuple[int, int], ...]:
+        """Get the precomputed block offsets for the current type and rotation."""
+        return self.CELLS[(self.type, self.rotation % self.NUM_ROTATIONS[self.type])]
     
     def get_blocks(self) -> List[Tuple[int, int]]:
         """Get list of (x, y) coordinates for all blocks in the piece."""
-        blocks = []
-        for row in range(4):
-            for col in range(4):
-                if self.shape[row][col]:
-                    blocks.append((self.x + col, self.y + row))
-        return blocks
+        x, y = self.x, self.y
+        return [(x + dx, y + dy) for dx, dy in self._rel_blocks()]
+    
+    def visible_blocks(self, min_y: int = 0) -> List[Tuple[int, int]]:
+        """Get the (x, y) coordinates of blocks at or below a given row.
+        
+        Args:
+            min_y: Smallest row index to include (0 is the top of the board)
+            
+        Returns:
+            List of block coordinates with y >= min_y
+        """
+        x, y = self.x, self.y
+        # Compare offsets against a single threshold instead of absolute rows
+        min_dy = min_y - y
+        return [(x + dx, y + dy) for dx, dy in self._rel_blocks() if dy >= min_dy]
     
     def rotate(self) -> 'Piece':
         """Return a new piece rotated clockwise."""
         new_piece = Piece(self.type, self.x, self.y)
-        new_piece.rotation = (self.rotation + 1) % len(self.SHAPES[self.type])
+        new_piece.rotation = (self.rotation + 1) % self.NUM_ROTATIONS[self.type]
         return new_piece
     
     def move(self, dx: int, dy: int) -> 'Piece':
@@ -6,19 +6,35 @@ using pyglet's OpenGL capabilities for enhanced visual experience.
 
 import pyglet
 from pyglet import shapes, gl
+import os
 import random
 import math
 from typing import List, Tuple, Optional
 from .constants import (
     PARTICLE_COUNT_RANGE, PARTICLE_SPEED_RANGE, PARTICLE_LIFE_RANGE,
     PARTICLE_SIZE_RANGE, PARTICLE_GRAVITY, PARTICLE_DRAG,
-    COLORS, CELL_SIZE, BOARD_WIDTH, BOARD_HEIGHT
+    COLORS, CELL_SIZE, BOARD_WIDTH, BOARD_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT
 )
 
+# Set TETRIS_DEBUG=1 to print effect placement diagnostics
+DEBUG = os.environ.get('TETRIS_DEBUG') == '1'
+
 
 class Particle:
     """Advanced particle with physics and visual effects."""
     
+    # Sparkles are created and updated in large numbers every frame
+    __slots__ = (
+        'x', 'y', 'vx', 'vy', 'initial_life', 'life', 'color',
+        'initial_size', 'size', 'gravity', 'drag', 'bounce',
+        'rotation', 'rotation_speed', 'alpha_decay', 'size_decay',
+        'trail_positions', 'max_trail_length',
+        '_circles', '_circles_batch', '_circles_group', '_hidden',
+    )
+    
+    # Particles fainter than this alpha are not drawn
+    MIN_VISIBLE_ALPHA = 4
+    
     def __init__(self, x: float, y: float, vx: float = 0, vy: float = 0,
                  life: float = 1.0, color: Tuple[int, int, int, int] = None,
                  size: float = 4.0):
@@ -58,6 +74,13 @@ class Particle:
         self.trail_positions = []
         self.max_trail_length = 5
         
+        # Pooled circles (trail..., glow, main, core), reused while the
+        # particle keeps drawing into the same batch and group
+        self._circles: List[shapes.Circle] = []
+        self._circles_batch = None
+        self._circles_group = None
+        self._hidden = False
+        
     def update(self, dt: float) -> bool:
         """Update particle physics and properties.
         
@@ -110,78 +133,131 @@ class Particle:
         alpha = int(255 * self.alpha_decay)
         return (r, g, b, alpha)
     
+    def _get_circles(self, batch: pyglet.graphics.Batch,
+                     group: pyglet.graphics.Group) -> List[shapes.Circle]:
+        """Get the pooled circles for this particle, creating them on first use.
+        
+        Args:
+            batch: Pyglet batch for rendering
+            group: Pyglet group for layering
+            
+        Returns:
+            List of circles: one per trail slot, then glow, main and core
+        """
+        if self._circles_batch is not batch or self._circles_group is not group:
+            self.release_shapes()
+            self._circles_batch = batch
+            self._circles_group = group
+            self._hidden = False
+            # Trail slots first so they keep drawing underneath the particle
+            self._circles = [
+                shapes.Circle(self.x, self.y, max(self.size, 1.0), batch=batch, group=group)
+                for _ in range(self.max_trail_length + 2)
+            ]
+        return self._circles
+    
+    def release_shapes(self) -> None:
+        """Delete the pooled circles."""
+        for circle in self._circles:
+            circle.delete()
+        self._circles = []
+        self._circles_batch = None
+        self._circles_group = None
+    
     def draw(self, batch: pyglet.graphics.Batch, group: pyglet.graphics.Group) -> List:
         """Draw the particle with advanced effects.
         
+        The circles are created once and updated in place on later calls.
+        Faded or off-window particles hide their circles instead.
+        
         Args:
             batch: Pyglet batch for rendering
             group: Pyglet group for layering
             
         Returns:
-            List of created shapes
+            List of the particle's shapes
         """
         if self.life <= 0 or self.size <= 0:
+            self.release_shapes()
             return []
         
-        shapes_list = []
+        circles = self._get_circles(batch, group)
         current_color = self.get_current_color()
         
+        # Hide particles that are almost transparent or entirely off-window
+        reach = self.size * 2
+        culled = (current_color[3] < self.MIN_VISIBLE_ALPHA
+                  or self.x < -reach or self.x > WINDOW_WIDTH + reach
+                  or self.y < -reach or self.y > WINDOW_HEIGHT + reach)
+        if culled != self._hidden:
+            for circle in circles:
+                circle.visible = not culled
+            self._hidden = culled
+        if culled:
+            return circles
+        
+        rgb = current_color[:3]
+        trail_slots = self.max_trail_length - 1
+        
         # Draw trail
-        if len(self.trail_positions) > 1:
-            for i, (tx, ty) in enumerate(self.trail_positions[:-1]):
-                trail_alpha = int(current_color[3] * (i / len(self.trail_positions)) * 0.5)
-                trail_size = self.size * (i / len(self.trail_positions)) * 0.5
-                
+        trail_count = len(self.trail_positions)
+        for i in range(trail_slots):
+            trail_circle = circles[i]
+            trail_alpha = 0
+            if trail_count > 1 and i < trail_count - 1:
+                tx, ty = self.trail_positions[i]
+                trail_alpha = int(current_color[3] * (i / trail_count) * 0.5)
+                trail_size = self.size * (i / trail_count) * 0.5
                 if trail_alpha > 0 and trail_size > 0:
-                    trail_circle = shapes.Circle(
-                        tx, ty, trail_size,
-                        color=current_color[:3],
-                        batch=batch, group=group
-                    )
-                    trail_circle.opacity = trail_alpha
-                    shapes_list.append(trail_circle)
+                    trail_circle.position = (tx, ty)
+                    trail_circle.radius = trail_size
+                    trail_circle.color = rgb
+                else:
+                    trail_alpha = 0
+            trail_circle.opacity = trail_alpha
         
         # Draw glow effect
-        glow_size = self.size * 2
-        glow_alpha = int(current_color[3] * 0.3)
-        if glow_alpha > 0:
-            glow_circle = shapes.Circle(
-                self.x, self.y, glow_size,
-                color=current_color[:3],
-                batch=batch, group=group
-            )
-            glow_circle.opacity = glow_alpha
-            shapes_list.append(glow_circle)
+        glow_circle = circles[trail_slots]
+        glow_circle.position = (self.x, self.y)
+        glow_circle.radius = self.size * 2
+        glow_circle.color = rgb
+        glow_circle.opacity = int(current_color[3] * 0.3)
         
         # Draw main particle
-        main_circle = shapes.Circle(
-            self.x, self.y, self.size,
-            color=current_color[:3],
-            batch=batch, group=group
-        )
+        main_circle = circles[trail_slots + 1]
+        main_circle.position = (self.x, self.y)
+        main_circle.radius = self.size
+        main_circle.color = rgb
         main_circle.opacity = current_color[3]
-        shapes_list.append(main_circle)
         
         # Draw core highlight
-        core_size = self.size * 0.4
-        core_color = tuple(min(255, c + 100) for c in current_color[:3])
-        core_alpha = int(current_color[3] * 0.8)
-        
-        if core_alpha > 0 and core_size > 0:
-            core_circle = shapes.Circle(
-                self.x, self.y, core_size,
-                color=core_color,
-                batch=batch, group=group
-            )
-            core_circle.opacity = core_alpha
-            shapes_list.append(core_circle)
+        core_circle = circles[trail_slots + 2]
+        core_circle.position = (self.x, self.y)
+        core_circle.radius = self.size * 0.4
+        core_circle.color = tuple(min(255, c + 100) for c in rgb)
+        core_circle.opacity = int(current_color[3] * 0.8)
         
-        return shapes_list
+        return circles
 
 
 class RainbowWaveEffect:
     """Creative rainbow wave line clearing effect with dynamic color transitions."""
     
+    # Rainbow colors for the wave
+    RAINBOW_COLORS = (
+        (255, 0, 0, 255),    # Red
+        (255, 127, 0, 255),  # Orange
+        (255, 255, 0, 255),  # Yellow
+        (0, 255, 0, 255),    # Green
+        (0, 0, 255, 255),    # Blue
+        (75, 0, 130, 255),   # Indigo
+        (148, 0, 211, 255),  # Violet
+    )
+    
+    # Number of precomputed samples along the rainbow gradient
+    RAINBOW_LUT_SIZE = 256
+    _rainbow_lut: Optional[Tuple[Tuple[int, int, int, int], ...]] = None
+    
     def __init__(self, line_y: int, board_x: int, board_y: int):
         """Initialize rainbow wave effect.
         
@@ -201,7 +277,8 @@ class RainbowWaveEffect:
         # Match the coordinate system used in renderer: y=0 is bottom of board, y=19 is top
         # Use the same formula as renderer._get_pixel_coords
         self.pixel_y = board_y + (BOARD_HEIGHT - 1 - line_y) * CELL_SIZE
-        print(f"Effect for line {line_y}: board_y={board_y}, pixel_y={self.pixel_y}, BOARD_HEIGHT={BOARD_HEIGHT}, CELL_SIZE={CELL_SIZE}")
+        if DEBUG:
+            print(f"Effect for line {line_y}: board_y={board_y}, pixel_y={self.pixel_y}, BOARD_HEIGHT={BOARD_HEIGHT}, CELL_SIZE={CELL_SIZE}")
         
         # Wave properties
         self.wave_center = BOARD_WIDTH // 2
@@ -210,15 +287,9 @@ class RainbowWaveEffect:
         self.wave_frequency = 2.0  # Frequency of wave oscillation
         
         # Rainbow colors for the wave
-        self.rainbow_colors = [
-            (255, 0, 0, 255),    # Red
-            (255, 127, 0, 255),  # Orange
-            (255, 255, 0, 255),  # Yellow
-            (0, 255, 0, 255),    # Green
-            (0, 0, 255, 255),    # Blue
-            (75, 0, 130, 255),   # Indigo
-            (148, 0, 211, 255),  # Violet
-        ]
+        self.rainbow_colors = self.RAINBOW_COLORS
+        if RainbowWaveEffect._rainbow_lut is None:
+            RainbowWaveEffect._rainbow_lut = self._build_rainbow_lut()
         
         # Particle effects for sparkles
         self.sparkle_particles: List[Particle] = []
@@ -229,8 +300,15 @@ class RainbowWaveEffect:
         self.lightning_timer = 0.0
         self.lightning_duration = 1
         
-    def _get_rainbow_color(self, position: float) -> Tuple[int, int, int, int]:
-        """Get rainbow color based on position (0.0 to 1.0).
+        # Pooled shapes, created on the first draw and updated in place
+        self._wave_circles: List[shapes.Circle] = []
+        self._lightning_rects: List[shapes.Rectangle] = []
+        self._shapes_batch: Optional[pyglet.graphics.Batch] = None
+        self._shapes_group: Optional[pyglet.graphics.Group] = None
+        
+    @classmethod
+    def _interpolate_rainbow(cls, position: float) -> Tuple[int, int, int, int]:
+        """Interpolate the rainbow gradient at a position (0.0 to 1.0).
         
         Args:
             position: Position along rainbow (0.0 to 1.0)
@@ -238,17 +316,18 @@ class RainbowWaveEffect:
         Returns:
             RGBA color tuple
         """
+        colors = cls.RAINBOW_COLORS
         # Normalize position to rainbow color array
-        color_index = position * (len(self.rainbow_colors) - 1)
+        color_index = position * (len(colors) - 1)
         index = int(color_index)
         fraction = color_index - index
         
-        if index >= len(self.rainbow_colors) - 1:
-            return self.rainbow_colors[-1]
+        if index >= len(colors) - 1:
+            return colors[-1]
         
         # Interpolate between two colors
-        color1 = self.rainbow_colors[index]
-        color2 = self.rainbow_colors[index + 1]
+        color1 = colors[index]
+        color2 = colors[index + 1]
         
         r = int(color1[0] + (color2[0] - color1[0]) * fraction)
         g = int(color1[1] + (color2[1] - color1[1]) * fraction)
@@ -256,6 +335,27 @@ class RainbowWaveEffect:
         
         return (r, g, b, 255)
     
+    @classmethod
+    def _build_rainbow_lut(cls) -> Tuple[Tuple[int, int, int, int], ...]:
+        """Sample the rainbow gradient into a lookup table.
+        
+        Returns:
+            Tuple of RAINBOW_LUT_SIZE RGBA colors
+        """
+        last = cls.RAINBOW_LUT_SIZE - 1
+        return tuple(cls._interpolate_rainbow(i / last) for i in range(cls.RAINBOW_LUT_SIZE))
+    
+    def _get_rainbow_color(self, position: float) -> Tuple[int, int, int, int]:
+        """Get rainbow color based on position (0.0 to 1.0).
+        
+        Args:
+            position: Position along rainbow (0.0 to 1.0)
+            
+        Returns:
+            RGBA color tuple
+        """
+        return self._rainbow_lut[int(position * (self.RAINBOW_LUT_SIZE - 1))]
+    
     def _create_sparkles(self, dt: float) -> None:
         """Create sparkle particles along the wave.
         
@@ -266,22 +366,28 @@ class RainbowWaveEffect:
         if self.last_sparkle_time >= 0.05:  # Create sparkles every 50ms
             self.last_sparkle_time = 0.0
             
+            # Values shared by every sparkle in this burst
+            randrange = random.randrange
+            uniform = random.uniform
+            wave_phase = self.progress * self.wave_frequency * 2 * math.pi
+            color_shift = self.progress * 2
+            
             # Create sparkles at random positions along the line
             for _ in range(3):
-                x = random.randint(0, BOARD_WIDTH - 1)
+                x = randrange(BOARD_WIDTH)
                 pixel_x = self.board_x + (x + 0.5) * CELL_SIZE
                 
                 # Wave offset
-                wave_offset = math.sin(self.progress * self.wave_frequency * 2 * math.pi + x * 0.5) * self.wave_amplitude
+                wave_offset = math.sin(wave_phase + x * 0.5) * self.wave_amplitude
                 
                 # Random sparkle properties
-                vx = random.uniform(-50, 50)
-                vy = random.uniform(50, 150)
-                life = random.uniform(0.3, 0.8)
-                size = random.uniform(2, 6)
+                vx = uniform(-50, 50)
+                vy = uniform(50, 150)
+                life = uniform(0.3, 0.8)
+                size = uniform(2, 6)
                 
                 # Rainbow color based on position
-                color_pos = (x / BOARD_WIDTH + self.progress * 2) % 1.0
+                color_pos = (x / BOARD_WIDTH + color_shift) % 1.0
                 color = self._get_rainbow_color(color_pos)
                 
                 sparkle = Particle(
@@ -339,85 +445,146 @@ class RainbowWaveEffect:
         # Effect is done when progress reaches 1.0
         if self.progress >= 1.0:
             self.active = False
+            # Drop the sparkles so their pooled circles leave the batch
+            self.sparkle_particles.clear()
         
         return self.active
     
+    def _bind_shapes(self, batch: pyglet.graphics.Batch,
+                     group: pyglet.graphics.Group) -> None:
+        """Create the pooled wave circles on first use or when the batch changes.
+        
+        Args:
+            batch: Pyglet batch for rendering
+            group: Pyglet group for layering
+        """
+        if self._shapes_batch is batch and self._shapes_group is group:
+            return
+        self.release_shapes()
+        self._shapes_batch = batch
+        self._shapes_group = group
+        # One main circle and one glow circle per column, in drawing order
+        self._wave_circles = [
+            shapes.Circle(0, 0, 1, batch=batch, group=group)
+            for _ in range(BOARD_WIDTH * 2)
+        ]
+    
+    def _get_lightning_rects(self, count: int) -> List[shapes.Rectangle]:
+        """Grow the lightning rectangle pool to at least count rectangles.
+        
+        Args:
+            count: Number of rectangles needed this frame
+            
+        Returns:
+            List of pooled lightning rectangles
+        """
+        while len(self._lightning_rects) < count:
+            self._lightning_rects.append(shapes.Rectangle(
+                0, 0, 1, 3, color=(255, 255, 255),
+                batch=self._shapes_batch, group=self._shapes_group
+            ))
+        return self._lightning_rects
+    
+    def release_shapes(self) -> None:
+        """Delete the pooled wave, lightning and sparkle shapes."""
+        for shape in self._wave_circles:
+            shape.delete()
+        for shape in self._lightning_rects:
+            shape.delete()
+        self._wave_circles = []
+        self._lightning_rects = []
+        self._shapes_batch = None
+        self._shapes_group = None
+        for particle in self.sparkle_particles:
+            particle.release_shapes()
+    
     def draw(self, batch: pyglet.graphics.Batch, group: pyglet.graphics.Group) -> List:
         """Draw rainbow wave effect.
         
+        The shapes are created once and updated in place on later calls,
+        so the batch is not rebuilt every frame.
+        
         Args:
             batch: Pyglet batch for rendering
             group: Pyglet group for layering
             
         Returns:
-            List of created shapes
+            List of the effect's shapes
         """
-        shapes_list = []
-        
         if not self.active:
-            return shapes_list
-
+            self.release_shapes()
+            return []
+        
+        self._bind_shapes(batch, group)
+        wave_circles = self._wave_circles
         
         # Draw wave effect
         wave_alpha = int(255 * (1.0 - self.progress) * 0.8)
-        if wave_alpha > 0:
-            for x in range(BOARD_WIDTH):
-                pixel_x = self.board_x + (x + 0.5) * CELL_SIZE
-                
-                # Calculate wave properties
-                wave_phase = self.progress * self.wave_speed + x * 0.3
-                wave_offset = math.sin(wave_phase) * self.wave_amplitude * (1.0 - self.progress)
-                
-                # Rainbow color based on position and time
-                color_pos = (x / BOARD_WIDTH + self.progress) % 1.0
-                color = self._get_rainbow_color(color_pos)
-                
-                # Draw main wave circle
-                wave_size = CELL_SIZE * 0.4 * (1.0 - self.progress * 0.5)
-                if wave_size > 0:
-                    wave_circle = shapes.Circle(
-                        pixel_x, self.pixel_y + wave_offset, wave_size,
-                        color=color[:3], batch=batch, group=group
-                    )
-                    wave_circle.opacity = wave_alpha
-                    shapes_list.append(wave_circle)
-                
-                # Draw glow effect
-                glow_size = wave_size * 2
-                glow_alpha = int(wave_alpha * 0.3)
-                if glow_size > 0 and glow_alpha > 0:
-                    glow_circle = shapes.Circle(
-                        pixel_x, self.pixel_y + wave_offset, glow_size,
-                        color=color[:3], batch=batch, group=group
-                    )
-                    glow_circle.opacity = glow_alpha
-                    shapes_list.append(glow_circle)
+        glow_alpha = int(wave_alpha * 0.3)
+        wave_size = CELL_SIZE * 0.4 * (1.0 - self.progress * 0.5)
+        glow_size = wave_size * 2
+        show_wave = wave_alpha > 0 and wave_size > 0
+        show_glow = wave_alpha > 0 and glow_size > 0 and glow_alpha > 0
+        for x in range(BOARD_WIDTH):
+            wave_circle = wave_circles[2 * x]
+            glow_circle = wave_circles[2 * x + 1]
+            wave_circle.visible = show_wave
+            glow_circle.visible = show_glow
+            if not (show_wave or show_glow):
+                continue
+            
+            pixel_x = self.board_x + (x + 0.5) * CELL_SIZE
+            
+            # Calculate wave properties
+            wave_phase = self.progress * self.wave_speed + x * 0.3
+            wave_offset = math.sin(wave_phase) * self.wave_amplitude * (1.0 - self.progress)
+            position = (pixel_x, self.pixel_y + wave_offset)
+            
+            # Rainbow color based on position and time
+            color_pos = (x / BOARD_WIDTH + self.progress) % 1.0
+            rgb = self._get_rainbow_color(color_pos)[:3]
+            
+            # Main wave circle
+            if show_wave:
+                wave_circle.position = position
+                wave_circle.radius = wave_size
+                wave_circle.color = rgb
+                wave_circle.opacity = wave_alpha
+            
+            # Glow effect
+            if show_glow:
+                glow_circle.position = position
+                glow_circle.radius = glow_size
+                glow_circle.color = rgb
+                glow_circle.opacity = glow_alpha
         
         # Draw lightning effect
-        if self.lightning_timer > 0:
+        segments = self.lightning_segments if self.lightning_timer > 0 else []
+        lightning_rects = self._get_lightning_rects(len(segments))
+        if segments:
             lightning_alpha = int(255 * (self.lightning_timer / self.lightning_duration))
-            for start, end in self.lightning_segments:
-                # Calculate line properties
-                dx = end[0] - start[0]
-                dy = end[1] - start[1]
-                length = math.sqrt(dx*dx + dy*dy)
-                if length > 0:
-                    # Create a thin rectangle to represent the lightning
-                    center_x = (start[0] + end[0]) / 2
-                    center_y = (start[1] + end[1]) / 2
-                    
-                    lightning_rect = shapes.Rectangle(
-                        center_x - length/2, center_y - 1.5, length, 3,
-                        color=(255, 255, 255), batch=batch, group=group
-                    )
-                    lightning_rect.opacity = lightning_alpha
-                    
-                    # Rotate the rectangle to match the line angle
-                    if dx != 0:
-                        angle = math.atan2(dy, dx)
-                        lightning_rect.rotation = math.degrees(angle)
-                    
-                    shapes_list.append(lightning_rect)
+        for i, lightning_rect in enumerate(lightning_rects):
+            if i >= len(segments):
+                lightning_rect.visible = False
+                continue
+            start, end = segments[i]
+            # Calculate line properties
+            dx = end[0] - start[0]
+            dy = end[1] - start[1]
+            length = math.sqrt(dx*dx + dy*dy)
+            lightning_rect.visible = length > 0
+            if length > 0:
+                # A thin rectangle represents the lightning
+                center_x = (start[0] + end[0]) / 2
+                center_y = (start[1] + end[1]) / 2
+                lightning_rect.position = (center_x - length/2, center_y - 1.5)
+                lightning_rect.width = length
+                lightning_rect.opacity = lightning_alpha
+                
+                # Rotate the rectangle to match the line angle
+                lightning_rect.rotation = math.degrees(math.atan2(dy, dx)) if dx != 0 else 0
+        
+        shapes_list = wave_circles + lightning_rects
         
         # Draw sparkle particles
         for particle in self.sparkle_particles:
@@ -426,15 +593,14 @@ class RainbowWaveEffect:
         return shapes_list
 
 
-
-
-
 class PygletEffectsManager:
     """Manages all visual effects for the pyglet Tetris game."""
     
     def __init__(self):
         """Initialize the effects manager."""
         self.line_effects: List[RainbowWaveEffect] = []
+        # Number of running effects, kept in step with line_effects
+        self.active_count = 0
         # Remove self.batch and self.group
         # Effects manager should always use the batch/group provided by the renderer
 
@@ -446,10 +612,24 @@ class PygletEffectsManager:
         """
         from .constants import BORDER_WIDTH
         # Calculate correct board position
-        board_x = BORDER_WIDTH
-        board_y = BORDER_WIDTH
+        self.add_line_clear_effect_at_position(line_y, BORDER_WIDTH, BORDER_WIDTH)
+    
+    def add_line_clear_effect_at_position(self, line_y: int, board_x: int,
+                                          board_y: int) -> RainbowWaveEffect:
+        """Add a line clearing effect for a board drawn at a given position.
+        
+        Args:
+            line_y: Line index being cleared
+            board_x: Board X coordinate (pixels)
+            board_y: Board Y coordinate (pixels)
+            
+        Returns:
+            The created effect
+        """
         line_effect = RainbowWaveEffect(line_y, board_x, board_y)
         self.line_effects.append(line_effect)
+        self.active_count += 1
+        return line_effect
     
     def update(self, dt: float) -> None:
         """Update all effects.
@@ -457,11 +637,15 @@ class PygletEffectsManager:
         Args:
             dt: Delta time in seconds
         """
-        # Update line explosion effects
-        self.line_effects = [
-            effect for effect in self.line_effects
-            if effect.update(dt)
-        ]
+        # Update line explosion effects, removing finished ones from the batch
+        active_effects = []
+        for effect in self.line_effects:
+            if effect.update(dt):
+                active_effects.append(effect)
+            else:
+                effect.release_shapes()
+        self.line_effects = active_effects
+        self.active_count = len(active_effects)
     
     def draw(self, batch: pyglet.graphics.Batch, 
              group: pyglet.graphics.Group = None) -> List:
@@ -488,11 +672,14 @@ class PygletEffectsManager:
         Returns:
             True if there are active effects
         """
-        return len(self.line_effects) > 0
+        return self.active_count > 0
     
     def clear_all_effects(self) -> None:
         """Clear all active effects."""
+        for effect in self.line_effects:
+            effect.release_shapes()
         self.line_effects.clear()
+        self.active_count = 0
 
 
 
@@ -437,7 +437,6 @@ class PygletTetrisGame:
         """Draw the game."""
         # Clear screen
         self.renderer.clear()
-        self.renderer.clear_effect_batch()  # Ensure effect batch is fresh each frame
         
         # Draw board, with skip_lines if in delay or falling animation
         if self._falling_animation_delay > 0.0 and self._falling_animation_delay_lines:
@@ -466,7 +465,7 @@ class PygletTetrisGame:
             self.renderer.draw_piece(self.current_piece)
         
         # Draw effects ON TOP of board and pieces
-        self.effects_manager.draw(self.renderer.effect_batch, self.renderer.effect_group)
+        self.renderer.draw_effects(self.effects_manager)
         
         # Calculate game time
         game_time = int(time.time() - self.game_start_time) if hasattr(self, 'game_start_time') else 0
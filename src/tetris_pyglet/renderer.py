@@ -18,9 +18,41 @@ from .board import Board
 from .piece import Piece
 
 
+class _BlendedShaderGroup(pyglet.graphics.ShaderGroup):
+    """Shader group that enables alpha blending, like pyglet's shape groups."""
+    
+    def set_state(self) -> None:
+        super().set_state()
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+    
+    def unset_state(self) -> None:
+        gl.glDisable(gl.GL_BLEND)
+        super().unset_state()
+
+
 class PygletRenderer:
     """Handles all game rendering using Pyglet and OpenGL."""
     
+    # Control hints shown in the sidebar
+    _CONTROLS = (
+        "← → Move",
+        "↓ Soft Drop",
+        "↑ Rotate",
+        "Space Hard Drop",
+        "P Pause",
+        "R Restart",
+    )
+    
+    # Sidebar layout: top margin and the height each draw_ui section takes
+    _SIDEBAR_TOP_MARGIN = 50
+    _NEXT_SECTION_HEIGHT = 160
+    _SCORE_SECTION_HEIGHT = 90
+    _LEVEL_SECTION_HEIGHT = 90
+    _LINES_SECTION_HEIGHT = 110
+    _CURRENT_SECTION_HEIGHT = 65
+    _TIME_SECTION_HEIGHT = 65
+    
     def __init__(self, window: pyglet.window.Window = None):
         """Initialize the renderer.
         
@@ -50,26 +82,42 @@ class PygletRenderer:
         
         # Create batch for efficient rendering
         self.main_batch = pyglet.graphics.Batch()
-        self.ui_batch = pyglet.graphics.Batch()
-        self.effect_batch = pyglet.graphics.Batch()
         
-        # Create groups for layered rendering
+        # Create groups for layered rendering (all share main_batch)
         self.background_group = pyglet.graphics.Group(order=0)
         self.board_group = pyglet.graphics.Group(order=1)
         self.piece_group = pyglet.graphics.Group(order=2)
         self.effect_group = pyglet.graphics.Group(order=3)
         self.ui_group = pyglet.graphics.Group(order=4)
+        self.controls_group = pyglet.graphics.Group(order=4)
         
         # Initialize fonts
         self.font_large = pyglet.font.load('Arial', 24)
         self.font_medium = pyglet.font.load('Arial', 16)
         self.font_small = pyglet.font.load('Arial', 12)
+        self._font_map = {
+            'large': self.font_large,
+            'medium': self.font_medium,
+            'small': self.font_small
+        }
         
         # Keep references to dynamic shapes to prevent garbage collection
         self.dynamic_shapes = []
         
-        # Create static UI elements
+        # Memoized per-color transforms used by _draw_cell
+        self._glow_color_cache = {}
+        self._highlight_color_cache = {}
+        
+        # Persistent sidebar labels and the values they currently show
+        self._ui_value_labels = {}
+        self._ui_state_cache = {'score': None, 'level': None, 'lines': None,
+                                'lines_to_next_level': None, 'current_type': None,
+                                'time': None, 'next_piece_type': None}
+        self._preview_shapes = []
+        
+        # Create static UI elements; the grid is added lazily on first draw_board
         self._create_static_elements()
+        self._static_elements_created = False
         
         # Animation time for effects
         self.animation_time = 0.0
@@ -92,15 +140,8 @@ class PygletRenderer:
             group=self.background_group
         )
         
-        # Game board background
-        self.board_bg = shapes.Rectangle(
-            self.board_x, self.board_y, GAME_WIDTH, GAME_HEIGHT,
-            color=COLORS['WHITE'][:3],
-            batch=self.main_batch,
-            group=self.background_group
-        )
-        
-        # Board border
+        # Board border, created before the board background so the
+        # background paints over all but its 2-pixel frame
         self.board_border = shapes.Rectangle(
             self.board_x - 2, self.board_y - 2, 
             GAME_WIDTH + 4, GAME_HEIGHT + 4,
@@ -109,6 +150,14 @@ class PygletRenderer:
             group=self.background_group
         )
         
+        # Game board background
+        self.board_bg = shapes.Rectangle(
+            self.board_x, self.board_y, GAME_WIDTH, GAME_HEIGHT,
+            color=COLORS['WHITE'][:3],
+            batch=self.main_batch,
+            group=self.background_group
+        )
+        
         # Sidebar background
         self.sidebar_bg = shapes.Rectangle(
             self.sidebar_x, 0, SIDEBAR_WIDTH, WINDOW_HEIGHT,
@@ -116,6 +165,34 @@ class PygletRenderer:
             batch=self.main_batch,
             group=self.background_group
         )
+        
+        self._create_static_controls()
+    
+    def _create_static_controls(self) -> None:
+        """Create the controls section labels once, since they never change."""
+        sidebar_x = self.sidebar_x + 20
+        # Start where draw_ui ends up with every section shown; draw_ui moves
+        # the labels up when optional sections are hidden
+        current_y = (WINDOW_HEIGHT - self._SIDEBAR_TOP_MARGIN
+                     - self._NEXT_SECTION_HEIGHT - self._SCORE_SECTION_HEIGHT
+                     - self._LEVEL_SECTION_HEIGHT - self._LINES_SECTION_HEIGHT
+                     - self._CURRENT_SECTION_HEIGHT - self._TIME_SECTION_HEIGHT)
+        self._controls_y = current_y
+        
+        self._static_control_labels = [
+            self._create_label("CONTROLS", sidebar_x, current_y, 'medium',
+                               COLORS['TEXT'][:3], batch=self.main_batch,
+                               group=self.controls_group)
+        ]
+        current_y -= 25
+        
+        for control in self._CONTROLS:
+            self._static_control_labels.append(
+                self._create_label(control, sidebar_x, current_y, 'small',
+                                   COLORS['GRAY'][:3], batch=self.main_batch,
+                                   group=self.controls_group)
+            )
+            current_y -= 20
     
     def _draw_cell(self, x: float, y: float, color: Tuple[int, int, int, int], 
                    size: float = CELL_SIZE, glow: float = 0.0, 
@@ -153,8 +230,7 @@ class PygletRenderer:
         # Draw glow effect if needed
         if glow > 0.0:
             glow_size = size + glow * 10
-            glow_alpha = int(glow * 50) / 255.0
-            glow_color = tuple(int(c * glow_alpha) for c in color[:3])
+            glow_color = self._get_glow_color(main_color, glow)
             glow_rect = shapes.Rectangle(
                 x - (glow_size - size) / 2,
                 y - (glow_size - size) / 2,
@@ -190,8 +266,7 @@ class PygletRenderer:
         shapes_list.append(main_rect)
         
         # Inner highlight for depth
-        highlight_alpha = 0.3
-        highlight_color = tuple(int(min(255, c + 40)) for c in main_color)
+        highlight_color = self._get_highlight_color(main_color)
         highlight_rect = shapes.Rectangle(
             x + 2, y + size - 3, size - 4, 1,
             color=highlight_color,
@@ -219,34 +294,72 @@ class PygletRenderer:
         self.dynamic_shapes.extend(shapes_list)
         return shapes_list
     
+    def _get_glow_color(self, rgb: Tuple[int, int, int], glow: float) -> Tuple[int, int, int]:
+        """Get the glow color for a base color, memoized per glow step.
+        
+        Args:
+            rgb: Base RGB color
+            glow: Glow intensity (0.0 to 1.0)
+            
+        Returns:
+            RGB glow color
+        """
+        key = (rgb, int(glow * 100))
+        glow_color = self._glow_color_cache.get(key)
+        if glow_color is None:
+            glow_alpha = int(glow * 50) / 255.0
+            glow_color = tuple(int(c * glow_alpha) for c in rgb)
+            self._glow_color_cache[key] = glow_color
+        return glow_color
+    
+    def _get_highlight_color(self, rgb: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Get the highlight color for a base color, memoized per color.
+        
+        Args:
+            rgb: Base RGB color
+            
+        Returns:
+            RGB highlight color
+        """
+        highlight_color = self._highlight_color_cache.get(rgb)
+        if highlight_color is None:
+            highlight_color = tuple(int(min(255, c + 40)) for c in rgb)
+            self._highlight_color_cache[rgb] = highlight_color
+        return highlight_color
+    
     def _draw_grid(self) -> None:
-        """Draw subtle grid lines."""
+        """Draw subtle grid lines.
+        
+        All lines live in a single static GL_LINES vertex list that is
+        uploaded once and never touched again.
+        """
         # Use a darker color for better contrast
         grid_color = (100, 100, 100, int(255 * GRID_ALPHA))
+        # Shift by half a pixel so each line lands on the same pixel row or
+        # column that a one-pixel-thick shapes.Line would cover
+        coords = []
         
         # Vertical lines
         for x in range(1, BOARD_WIDTH):
-            line_x = self.board_x + x * CELL_SIZE
-            line = shapes.Line(
-                line_x, self.board_y,
-                line_x, self.board_y + GAME_HEIGHT,
-                color=grid_color[:3],
-                batch=self.main_batch,
-                group=self.board_group
-            )
-            line.opacity = grid_color[3]
+            line_x = self.board_x + x * CELL_SIZE - 0.5
+            coords.extend((line_x, self.board_y, line_x, self.board_y + GAME_HEIGHT))
         
         # Horizontal lines
         for y in range(1, BOARD_HEIGHT):
-            line_y = self.board_y + y * CELL_SIZE
-            line = shapes.Line(
-                self.board_x, line_y,
-                self.board_x + GAME_WIDTH, line_y,
-                color=grid_color[:3],
-                batch=self.main_batch,
-                group=self.board_group
-            )
-            line.opacity = grid_color[3]
+            line_y = self.board_y + y * CELL_SIZE - 0.5
+            coords.extend((self.board_x, line_y, self.board_x + GAME_WIDTH, line_y))
+        
+        count = len(coords) // 2
+        program = shapes.get_default_shader()
+        # Order -1 keeps the grid underneath the cells in the board group
+        self.grid_group = _BlendedShaderGroup(program, order=-1, parent=self.board_group)
+        self.grid_lines = program.vertex_list(
+            count, gl.GL_LINES, self.main_batch, self.grid_group,
+            position=('f', coords),
+            colors=('Bn', grid_color * count),
+            translation=('f', (0.0, 0.0) * count),
+            rotation=('f', (0.0,) * count)
+        )
     
     def draw_board(self, board: Board, falling_animation: dict = None, skip_lines: list = None) -> None:
         """Draw the game board, with optional falling animation and lines to skip (not render)."""
@@ -268,9 +381,8 @@ class PygletRenderer:
                     self._draw_board_block(board, x, y, color, fall_offset)
     
     def _ensure_static_elements_created(self) -> None:
-        """Ensure static elements are created only once."""
-        if not hasattr(self, '_static_elements_created'):
-            self._create_static_elements()
+        """Ensure the grid is created only once; other static elements come from __init__."""
+        if not self._static_elements_created:
             self._draw_grid()
             self._static_elements_created = True
     
@@ -411,22 +523,29 @@ class PygletRenderer:
             color, size, glow
         )
     
-    def draw_preview_piece(self, piece: Piece, x: int, y: int) -> None:
+    def draw_preview_piece(self, piece: Piece, x: int, y: int) -> List:
         """Draw a preview piece in the sidebar.
         
         Args:
             piece: The piece to preview
             x: X position in the sidebar
             y: Y position in the sidebar
+            
+        Returns:
+            List of created shapes
         """
         shape = piece.get_shape()
         preview_cell_size = CELL_SIZE / 2
+        shapes_list = []
         
         for row in range(4):
             for col in range(4):
                 if shape[row][col]:
                     pixel_x, pixel_y = self._get_preview_pixel_position(x, y, col, row, preview_cell_size)
-                    self._draw_preview_cell(pixel_x, pixel_y, piece.color, preview_cell_size)
+                    shapes_list.extend(
+                        self._draw_preview_cell(pixel_x, pixel_y, piece.color, preview_cell_size)
+                    )
+        return shapes_list
     
     def _get_preview_pixel_position(self, base_x: int, base_y: int, col: int, row: int, cell_size: float) -> Tuple[int, int]:
         """Get pixel position for preview piece cell.
@@ -445,7 +564,7 @@ class PygletRenderer:
         pixel_y = base_y + (2 - row) * cell_size
         return pixel_x, pixel_y
     
-    def _draw_preview_cell(self, pixel_x: int, pixel_y: int, color: Tuple[int, int, int, int], size: float) -> None:
+    def _draw_preview_cell(self, pixel_x: int, pixel_y: int, color: Tuple[int, int, int, int], size: float) -> List:
         """Draw a single preview cell.
         
         Args:
@@ -453,17 +572,21 @@ class PygletRenderer:
             pixel_y: Pixel y position
             color: Cell color
             size: Cell size
+            
+        Returns:
+            List of created shapes
         """
-        self._draw_cell(
+        return self._draw_cell(
             pixel_x, pixel_y, color,
-            size, batch=self.ui_batch,
-            group=self.ui_group
+            size, group=self.ui_group
         )
     
-    def draw_text(self, text_str: str, x: int, y: int, 
-                  font_size: str = 'medium', color: Tuple[int, int, int] = None,
-                  anchor_x: str = 'left', anchor_y: str = 'bottom') -> text.Label:
-        """Draw text on the screen.
+    def _create_label(self, text_str: str, x: int, y: int,
+                      font_size: str = 'medium', color: Tuple[int, int, int] = None,
+                      anchor_x: str = 'left', anchor_y: str = 'bottom',
+                      batch: pyglet.graphics.Batch = None,
+                      group: pyglet.graphics.Group = None) -> text.Label:
+        """Create a text label without tracking it for per-frame cleanup.
         
         Args:
             text_str: Text to draw
@@ -473,22 +596,22 @@ class PygletRenderer:
             color: Text color
             anchor_x: Horizontal anchor
             anchor_y: Vertical anchor
+            batch: Pyglet batch for rendering
+            group: Pyglet group for layering
             
         Returns:
             Created text label
         """
         if color is None:
             color = COLORS['TEXT'][:3]
+        if batch is None:
+            batch = self.main_batch
+        if group is None:
+            group = self.ui_group
         
-        font_map = {
-            'large': self.font_large,
-            'medium': self.font_medium,
-            'small': self.font_small
-        }
-        
-        font = font_map.get(font_size, self.font_medium)
+        font = self._font_map.get(font_size, self.font_medium)
         
-        label = text.Label(
+        return text.Label(
             text_str,
             font_name=font.name,
             font_size=font.size,
@@ -496,9 +619,28 @@ class PygletRenderer:
             anchor_x=anchor_x,
             anchor_y=anchor_y,
             color=(*color, 255),
-            batch=self.ui_batch,
-            group=self.ui_group
+            batch=batch,
+            group=group
         )
+    
+    def draw_text(self, text_str: str, x: int, y: int, 
+                  font_size: str = 'medium', color: Tuple[int, int, int] = None,
+                  anchor_x: str = 'left', anchor_y: str = 'bottom') -> text.Label:
+        """Draw text on the screen.
+        
+        Args:
+            text_str: Text to draw
+            x: X position
+            y: Y position
+            font_size: Font size ('large', 'medium', 'small')
+            color: Text color
+            anchor_x: Horizontal anchor
+            anchor_y: Vertical anchor
+            
+        Returns:
+            Created text label
+        """
+        label = self._create_label(text_str, x, y, font_size, color, anchor_x, anchor_y)
         
         # Add to tracking list for cleanup
         if not hasattr(self, '_ui_labels'):
@@ -519,10 +661,11 @@ class PygletRenderer:
             current_piece: Current falling piece
             game_time: Game time in seconds
         """
+        # Only transient labels (pause/game over) are rebuilt; sidebar labels persist
         self._clear_ui_labels()
         
         sidebar_x = self.sidebar_x + 20
-        current_y = WINDOW_HEIGHT - 50
+        current_y = WINDOW_HEIGHT - self._SIDEBAR_TOP_MARGIN
         
         # Draw UI sections in order
         current_y = self._draw_next_piece_section(next_piece, sidebar_x, current_y)
@@ -539,6 +682,56 @@ class PygletRenderer:
             label.delete()
         self._ui_labels = []
     
+    def _show_ui_label(self, key: str, text_str: str, x: int, y: int,
+                       font_size: str, color: Tuple[int, int, int]) -> None:
+        """Show a persistent sidebar label, touching it only when something changed.
+        
+        Args:
+            key: Label identifier
+            text_str: Text to display
+            x: X position
+            y: Y position
+            font_size: Font size ('large', 'medium', 'small')
+            color: Text color
+        """
+        label = self._ui_value_labels.get(key)
+        if label is None:
+            self._ui_value_labels[key] = self._create_label(text_str, x, y, font_size, color)
+            return
+        if label.text != text_str:
+            label.text = text_str
+        if label.x != x or label.y != y:
+            label.position = (x, y, 0)
+        if not label.visible:
+            label.visible = True
+    
+    def _hide_ui_labels(self, *keys: str) -> None:
+        """Hide persistent sidebar labels.
+        
+        Args:
+            keys: Label identifiers
+        """
+        for key in keys:
+            label = self._ui_value_labels.get(key)
+            if label is not None and label.visible:
+                label.visible = False
+    
+    def _value_text(self, key: str, value, fmt=str) -> str:
+        """Format a sidebar value, reusing the label text when the value is unchanged.
+        
+        Args:
+            key: State cache key
+            value: Value to display
+            fmt: Formatter applied when the value changed
+            
+        Returns:
+            Text for the value label
+        """
+        if self._ui_state_cache.get(key) == value and key in self._ui_value_labels:
+            return self._ui_value_labels[key].text
+        self._ui_state_cache[key] = value
+        return fmt(value)
+    
     def _draw_next_piece_section(self, next_piece: Optional[Piece], sidebar_x: int, current_y: int) -> int:
         """Draw the next piece preview section.
         
@@ -551,14 +744,27 @@ class PygletRenderer:
             Updated y position
         """
         if next_piece:
-            self.draw_text("NEXT", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-            current_y -= 40
-            preview_x = sidebar_x + 10
-            preview_y = current_y - 60
-            self.draw_preview_piece(next_piece, preview_x, preview_y)
-            current_y -= 120
+            self._show_ui_label('next_title', "NEXT", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
+            # Rebuild the preview only when the next piece changes
+            if next_piece.type != self._ui_state_cache['next_piece_type']:
+                self._clear_preview_shapes()
+                preview_x = sidebar_x + 10
+                preview_y = current_y - 100
+                self._preview_shapes = self.draw_preview_piece(next_piece, preview_x, preview_y)
+                self._ui_state_cache['next_piece_type'] = next_piece.type
+            current_y -= self._NEXT_SECTION_HEIGHT
+        else:
+            self._hide_ui_labels('next_title')
+            self._clear_preview_shapes()
         return current_y
     
+    def _clear_preview_shapes(self) -> None:
+        """Delete the next piece preview shapes."""
+        for shape in self._preview_shapes:
+            shape.delete()
+        self._preview_shapes = []
+        self._ui_state_cache['next_piece_type'] = None
+    
     def _draw_score_section(self, score: int, sidebar_x: int, current_y: int) -> int:
         """Draw the score section.
         
@@ -570,11 +776,10 @@ class PygletRenderer:
         Returns:
             Updated y position
         """
-        self.draw_text("SCORE", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-        current_y -= 30
-        self.draw_text(f"{score:,}", sidebar_x, current_y, 'large', COLORS['ACCENT'][:3])
-        current_y -= 60
-        return current_y
+        self._show_ui_label('score_title', "SCORE", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
+        score_text = self._value_text('score', score, "{:,}".format)
+        self._show_ui_label('score', score_text, sidebar_x, current_y - 30, 'large', COLORS['ACCENT'][:3])
+        return current_y - self._SCORE_SECTION_HEIGHT
     
     def _draw_level_section(self, level: int, sidebar_x: int, current_y: int) -> int:
         """Draw the level section.
@@ -587,11 +792,10 @@ class PygletRenderer:
         Returns:
             Updated y position
         """
-        self.draw_text("LEVEL", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-        current_y -= 30
-        self.draw_text(str(level), sidebar_x, current_y, 'large', COLORS['ACCENT'][:3])
-        current_y -= 60
-        return current_y
+        self._show_ui_label('level_title', "LEVEL", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
+        level_text = self._value_text('level', level)
+        self._show_ui_label('level', level_text, sidebar_x, current_y - 30, 'large', COLORS['ACCENT'][:3])
+        return current_y - self._LEVEL_SECTION_HEIGHT
     
     def _draw_lines_section(self, lines: int, level: int, sidebar_x: int, current_y: int) -> int:
         """Draw the lines section with next level progress.
@@ -605,17 +809,20 @@ class PygletRenderer:
         Returns:
             Updated y position
         """
-        self.draw_text("LINES", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-        current_y -= 30
-        self.draw_text(str(lines), sidebar_x, current_y, 'large', COLORS['ACCENT'][:3])
-        current_y -= 50
+        self._show_ui_label('lines_title', "LINES", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
+        lines_text = self._value_text('lines', lines)
+        self._show_ui_label('lines', lines_text, sidebar_x, current_y - 30, 'large', COLORS['ACCENT'][:3])
         
         # Next level progress
         lines_to_next_level = (level * 10) - lines
         if lines_to_next_level > 0:
-            self.draw_text(f"Next Level: {lines_to_next_level} lines", sidebar_x, current_y, 'small', COLORS['TEXT'][:3])
-        current_y -= 30
-        return current_y
+            progress_text = self._value_text('lines_to_next_level', lines_to_next_level,
+                                             "Next Level: {} lines".format)
+            self._show_ui_label('lines_to_next_level', progress_text, sidebar_x, current_y - 80,
+                                'small', COLORS['TEXT'][:3])
+        else:
+            self._hide_ui_labels('lines_to_next_level')
+        return current_y - self._LINES_SECTION_HEIGHT
     
     def _draw_current_piece_section(self, current_piece: Optional[Piece], sidebar_x: int, current_y: int) -> int:
         """Draw the current piece section.
@@ -629,10 +836,12 @@ class PygletRenderer:
             Updated y position
         """
         if current_piece:
-            self.draw_text("CURRENT", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-            current_y -= 25
-            self.draw_text(f"Type: {current_piece.type}", sidebar_x, current_y, 'small', COLORS['ACCENT'][:3])
-            current_y -= 40
+            self._show_ui_label('current_title', "CURRENT", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
+            type_text = self._value_text('current_type', current_piece.type, "Type: {}".format)
+            self._show_ui_label('current_type', type_text, sidebar_x, current_y - 25, 'small', COLORS['ACCENT'][:3])
+            current_y -= self._CURRENT_SECTION_HEIGHT
+        else:
+            self._hide_ui_labels('current_title', 'current_type')
         return current_y
     
     def _draw_time_section(self, game_time: Optional[int], sidebar_x: int, current_y: int) -> int:
@@ -647,15 +856,19 @@ class PygletRenderer:
             Updated y position
         """
         if game_time is not None:
-            self.draw_text("TIME", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-            current_y -= 25
-            time_str = self._format_time(game_time)
-            self.draw_text(time_str, sidebar_x, current_y, 'small', COLORS['ACCENT'][:3])
-            current_y -= 40
+            self._show_ui_label('time_title', "TIME", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
+            time_str = self._value_text('time', game_time, self._format_time)
+            self._show_ui_label('time', time_str, sidebar_x, current_y - 25, 'small', COLORS['ACCENT'][:3])
+            current_y -= self._TIME_SECTION_HEIGHT
+        else:
+            self._hide_ui_labels('time_title', 'time')
         return current_y
     
     def _draw_controls_section(self, sidebar_x: int, current_y: int) -> int:
-        """Draw the controls section.
+        """Place the controls section below the sections drawn above it.
+        
+        The controls labels are created once by _create_static_controls;
+        they are only moved when the sections above change height.
         
         Args:
             sidebar_x: Sidebar x position
@@ -664,23 +877,12 @@ class PygletRenderer:
         Returns:
             Updated y position
         """
-        self.draw_text("CONTROLS", sidebar_x, current_y, 'medium', COLORS['TEXT'][:3])
-        current_y -= 25
-        
-        controls = [
-            "← → Move",
-            "↓ Soft Drop",
-            "↑ Rotate",
-            "Space Hard Drop",
-            "P Pause",
-            "R Restart"
-        ]
-        
-        for control in controls:
-            self.draw_text(control, sidebar_x, current_y, 'small', COLORS['GRAY'][:3])
-            current_y -= 20
-        
-        return current_y
+        offset = current_y - self._controls_y
+        if offset:
+            for label in self._static_control_labels:
+                label.y += offset
+            self._controls_y = current_y
+        return current_y - 25 - 20 * len(self._CONTROLS)
     
     def _format_time(self, game_time: int) -> str:
         """Format game time as MM:SS.
@@ -718,10 +920,11 @@ class PygletRenderer:
         overlay = shapes.Rectangle(
             0, 0, WINDOW_WIDTH, WINDOW_HEIGHT,
             color=(0, 0, 0),
-            batch=self.effect_batch,
+            batch=self.main_batch,
             group=self.effect_group
         )
         overlay.opacity = opacity
+        self.dynamic_shapes.append(overlay)
     
     def _draw_game_over_text(self, final_score: int) -> None:
         """Draw game over text elements.
@@ -790,18 +993,21 @@ class PygletRenderer:
         """Clear the screen."""
         self.window.clear()
     
+    def draw_effects(self, effects_manager) -> None:
+        """Draw effects on top of the board and pieces.
+        
+        Args:
+            effects_manager: Effects manager whose effects should be drawn
+        """
+        # Keep references so the shapes survive until the next frame
+        self.dynamic_shapes.extend(effects_manager.draw(self.main_batch, self.effect_group))
+    
     def draw(self) -> None:
-        """Draw all batches."""
+        """Draw the batch; group order keeps effects and UI on top."""
         self.main_batch.draw()
-        self.effect_batch.draw()
-        self.ui_batch.draw()
         
     
     def cleanup(self) -> None:
         """Clean up resources."""
         # Pyglet handles most cleanup automatically
-        pass
-
-    def clear_effect_batch(self) -> None:
-        """Clear the effect batch so it can be redrawn this frame."""
-        self.effect_batch = pyglet.graphics.Batch()
\ No newline at end of file
+        pass
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Shared helpers for the effect position/visual test scripts.
+"""
+
+from tetris_pyglet.effects import RainbowWaveEffect
+
+
+def make_effect(line_y: int, board_x: int, board_y: int) -> RainbowWaveEffect:
+    """Create a fresh rainbow wave effect for a line.
+    
+    Effects are stateful (progress, pooled shapes), so every call returns a
+    new instance rather than a shared one.
+    
+    Args:
+        line_y: Board line the effect is attached to
+        board_x: Board x position in pixels
+        board_y: Board y position in pixels
+        
+    Returns:
+        New effect instance for these arguments
+    """
+    return RainbowWaveEffect(line_y, board_x, board_y)
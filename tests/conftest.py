@@ -0,0 +1,23 @@
+"""Shared pytest configuration for the Tetris test suite."""
+
+import pathlib
+import sys
+
+import pytest
+
+# Make the packages under src/ and the shared test helpers importable
+TESTS_DIR = pathlib.Path(__file__).resolve().parent
+SRC_DIR = TESTS_DIR.parent / 'src'
+for path in (str(SRC_DIR), str(TESTS_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope='session')
+def pyglet_display():
+    """Open pyglet's default display once per session, skipping without one."""
+    pyglet = pytest.importorskip('pyglet')
+    try:
+        return pyglet.window.get_platform().get_default_display()
+    except Exception as e:
+        pytest.skip(f"no pyglet display available: {e}")
@@ -8,9 +8,10 @@ from tetris.constants import COLORS
 
 # Create board
 board = Board()
+grid = board.grid
 
 # Place a block manually at (5, 19)
-board.grid[19][5] = COLORS['RED']
+grid[19][5] = COLORS['RED']
 print("Placed block at (5, 19)")
 
 # Test collision with O piece at (4, 18)
@@ -19,7 +20,7 @@ print(f"\nO piece at (4, 18) blocks:")
 for block_x, block_y in piece1.get_blocks():
     print(f"  Block at ({block_x}, {block_y})")
     if block_y < board.height and block_x < board.width:
-        occupied = board.grid[block_y][block_x] is not None
+        occupied = grid[block_y][block_x] is not None
         print(f"    Cell ({block_x}, {block_y}) is {'occupied' if occupied else 'empty'}")
 
 print(f"\nIs O piece at (4, 18) valid? {board.is_valid_position(piece1)}")
@@ -30,7 +31,7 @@ print(f"\nO piece at (6, 18) blocks:")
 for block_x, block_y in piece2.get_blocks():
     print(f"  Block at ({block_x}, {block_y})")
     if block_y < board.height and block_x < board.width:
-        occupied = board.grid[block_y][block_x] is not None
+        occupied = grid[block_y][block_x] is not None
         print(f"    Cell ({block_x}, {block_y}) is {'occupied' if occupied else 'empty'}")
 
 print(f"\nIs O piece at (6, 18) valid? {board.is_valid_position(piece2)}")
\ No newline at end of file
@@ -5,6 +5,8 @@ sys.path.insert(0, 'src')
 from tetris.game import Game
 from tetris.piece import Piece
 
+_RED = (255, 0, 0)
+
 # Create game
 game = Game()
 
@@ -12,12 +14,15 @@ print(f"Initial game_over: {game.game_over}")
 print(f"Current piece position: ({game.current_piece.x}, {game.current_piece.y})")
 print(f"Current piece type: {game.current_piece.type}")
 
+grid = game.board.grid
+W = game.board.width
+H = game.board.height
+
 # Fill top row to trigger game over
-for x in range(game.board.width):
-    game.board.grid[0][x] = (255, 0, 0)
+grid[0][:] = [_RED] * W
 
 print("\nFilled top row")
-print("Top row:", ['X' if cell is not None else '.' for cell in game.board.grid[0]])
+print("Top row:", ''.join('X' if cell is not None else '.' for cell in grid[0]))
 
 # Test if current piece is valid
 print(f"\nIs current piece valid? {game.board.is_valid_position(game.current_piece)}")
@@ -35,5 +40,5 @@ print(f"Is new piece valid? {game.board.is_valid_position(game.current_piece)}")
 print("\nNew piece blocks:")
 for block_x, block_y in game.current_piece.get_blocks():
     print(f"  Block at ({block_x}, {block_y})")
-    if block_y >= 0 and block_y < game.board.height and block_x >= 0 and block_x < game.board.width:
-        print(f"    Cell at ({block_x}, {block_y}) is {'occupied' if game.board.grid[block_y][block_x] is not None else 'empty'}")
\ No newline at end of file
+    if 0 <= block_y < H and 0 <= block_x < W:
+        print(f"    Cell at ({block_x}, {block_y}) is {'occupied' if grid[block_y][block_x] is not None else 'empty'}")
\ No newline at end of file
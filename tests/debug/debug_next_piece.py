@@ -44,15 +44,10 @@ def test_next_piece_preview():
     print("Preview should be visible on screen. Press any key to continue...")
     
     # Wait for user input
-    clock = pygame.time.Clock()
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                waiting = False
-            elif event.type == pygame.KEYDOWN:
-                waiting = False
-        clock.tick(60)
+    while True:
+        event = pygame.event.wait()
+        if event.type in (pygame.QUIT, pygame.KEYDOWN):
+            break
     
     renderer.quit()
 
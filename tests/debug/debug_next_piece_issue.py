@@ -44,11 +44,10 @@ def main():
     
     # Wait for user input
     print("Press any key in the pygame window to quit...")
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or event.type == pygame.KEYDOWN:
-                running = False
+    while True:
+        event = pygame.event.wait()
+        if event.type in (pygame.QUIT, pygame.KEYDOWN):
+            break
     
     pygame.quit()
 
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pygame
@@ -14,9 +15,11 @@ def main():
     # Create game instance
     game = Game()
     
+    piece_blocks = game.next_piece.get_blocks()
+    
     print(f"Next piece shape: {game.next_piece.shape}")
     print(f"Next piece position: ({game.next_piece.x}, {game.next_piece.y})")
-    print(f"Next piece blocks: {game.next_piece.get_blocks()}")
+    print(f"Next piece blocks: {piece_blocks}")
     
     # Debug draw_next_piece parameters
     sidebar_x = GAME_WIDTH + BORDER_WIDTH * 2
@@ -54,12 +57,19 @@ def main():
         print(f"Box bottom edge: {preview_y + preview_size}, Window height: {WINDOW_HEIGHT}")
     
     # Calculate piece position within preview
-    piece_blocks = game.next_piece.get_blocks()
     if piece_blocks:
-        min_x = min(block[0] for block in piece_blocks)
-        max_x = max(block[0] for block in piece_blocks)
-        min_y = min(block[1] for block in piece_blocks)
-        max_y = max(block[1] for block in piece_blocks)
+        # Single pass over the blocks for the bounding box
+        min_x, min_y = piece_blocks[0]
+        max_x, max_y = min_x, min_y
+        for bx, by in piece_blocks:
+            if bx < min_x:
+                min_x = bx
+            elif bx > max_x:
+                max_x = bx
+            if by < min_y:
+                min_y = by
+            elif by > max_y:
+                max_y = by
         
         piece_width = (max_x - min_x + 1) * cell_size
         piece_height = (max_y - min_y + 1) * cell_size
@@ -83,7 +93,8 @@ def main():
     
     # Run the game briefly to test rendering
     print("\nStarting game for visual test...")
-    clock = pygame.time.Clock()
+    frame_time = 1 / 60
+    start = time.perf_counter()
     running = True
     frames = 0
     
@@ -93,8 +104,9 @@ def main():
                 running = False
         
         game.render()
-        clock.tick(60)
         frames += 1
+        # Sleep until this frame's deadline so the loop ends at 1.0 s wall time
+        time.sleep(max(0.0, start + frames * frame_time - time.perf_counter()))
     
     pygame.quit()
     print("Debug complete.")
@@ -6,20 +6,21 @@ from tetris.board import Board
 from tetris.piece import Piece
 from tetris.game import Game
 
+_RED = (255, 0, 0)
+
 # Create a board and test line clearing
 board = Board()
+grid = board.grid
 
 # Fill bottom row except for positions 3-6 (where I piece will go)
 for x in range(board.width):
     if x < 3 or x > 6:  # Leave space for I piece
-        board.grid[19][x] = (255, 0, 0)
+        grid[19][x] = _RED
 
 print("Board before placing piece:")
 for y in range(18, 20):
-    row = []
-    for x in range(board.width):
-        row.append('X' if board.grid[y][x] is not None else '.')
-    print(f"Row {y}: {''.join(row)}")
+    row = ''.join('X' if c is not None else '.' for c in grid[y])
+    print(f"Row {y}: {row}")
 
 # Create I piece at position (3, 18) - this should be horizontal and fill row 19
 piece = Piece('I', 3, 18)
@@ -35,10 +36,8 @@ if board.is_valid_position(piece):
     
     print("\nBoard after placing piece:")
     for y in range(18, 20):
-        row = []
-        for x in range(board.width):
-            row.append('X' if board.grid[y][x] is not None else '.')
-        print(f"Row {y}: {''.join(row)}")
+        row = ''.join('X' if c is not None else '.' for c in grid[y])
+        print(f"Row {y}: {row}")
     
     # Check for full lines
     full_lines = board.get_full_lines()
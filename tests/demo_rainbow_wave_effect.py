@@ -9,7 +9,6 @@ RainbowWaveEffect Demo
 """
 
 import pyglet
-import time
 import sys
 import os
 import random
@@ -17,12 +16,26 @@ import random
 # 添加项目路径到sys.path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from tetris_pyglet.effects import PygletEffectsManager, RainbowWaveEffect
+from tetris_pyglet.effects import PygletEffectsManager
 from tetris_pyglet.constants import *
 
+# 设置TETRIS_DEBUG=1时打印每次触发、切换和清除的调试信息
+DEBUG = os.environ.get('TETRIS_DEBUG') == '1'
+
 class RainbowWaveDemo(pyglet.window.Window):
     """RainbowWaveEffect演示窗口"""
     
+    # 侧边栏最多显示的效果详情条数
+    MAX_DETAIL_LABELS = 5
+    
+    # 效果以固定步长模拟；活跃效果超过阈值时把多个步长合并成一次更新
+    SIM_STEP = 1 / 60.0
+    MAX_SIM_STEPS = 4
+    LOAD_SHED_THRESHOLD = 4
+    
+    # 自动演示最多同时保留的效果数
+    MAX_CONCURRENT = 8
+    
     def __init__(self):
         super().__init__(width=WINDOW_WIDTH, height=WINDOW_HEIGHT, 
                          caption="RainbowWave Effect Demo - 彩虹波浪效果演示")
@@ -31,21 +44,35 @@ class RainbowWaveDemo(pyglet.window.Window):
         pyglet.gl.glEnable(pyglet.gl.GL_BLEND)
         pyglet.gl.glBlendFunc(pyglet.gl.GL_SRC_ALPHA, pyglet.gl.GL_ONE_MINUS_SRC_ALPHA)
         
+        # 设置背景色（OpenGL会保留该状态，只需设置一次）
+        pyglet.gl.glClearColor(*[c / 255.0 for c in COLORS['BACKGROUND']])
+        
         # 创建效果管理器
         self.effects_manager = PygletEffectsManager()
         
         # 演示状态
         self.auto_demo = True
-        self.last_auto_trigger = 0
         self.auto_interval = 2.5  # 自动触发间隔（秒）
-        
-        # 创建UI标签
-        self.create_ui_labels()
+        # 距上次自动触发累计的时间（秒），初始值保证第一帧就触发
+        self._since_auto_trigger = float('inf')
+        self._sim_accum = 0.0  # 尚未模拟的时间（秒）
         
         # 游戏板位置
         self.board_x = BORDER_WIDTH
         self.board_y = BORDER_WIDTH
         
+        # 静态元素（游戏板、侧边栏）、效果和动态文字各用一个batch
+        self.static_batch = pyglet.graphics.Batch()
+        self.dynamic_batch = pyglet.graphics.Batch()
+        self.effect_batch = pyglet.graphics.Batch()
+        self.effect_group = pyglet.graphics.Group(order=0)
+        self._effect_shapes = []
+        
+        # 创建UI标签和静态场景元素
+        self.create_ui_labels()
+        self.create_board_elements()
+        self.create_sidebar_elements()
+        
         print("RainbowWave Effect Demo Started!")
         print("Controls:")
         print("  SPACE - 手动触发彩虹波浪效果")
@@ -62,7 +89,8 @@ class RainbowWaveDemo(pyglet.window.Window):
             font_size=24,
             x=self.width // 2, y=self.height - 40,
             anchor_x='center', anchor_y='center',
-            color=COLORS['TEXT']
+            color=COLORS['TEXT'],
+            batch=self.dynamic_batch
         )
         
         self.info_label = pyglet.text.Label(
@@ -71,7 +99,8 @@ class RainbowWaveDemo(pyglet.window.Window):
             font_size=14,
             x=self.width // 2, y=self.height - 70,
             anchor_x='center', anchor_y='center',
-            color=COLORS['TEXT']
+            color=COLORS['TEXT'],
+            batch=self.dynamic_batch
         )
         
         self.status_label = pyglet.text.Label(
@@ -79,7 +108,8 @@ class RainbowWaveDemo(pyglet.window.Window):
             font_name='Arial',
             font_size=12,
             x=20, y=50,
-            color=COLORS['ACCENT']
+            color=COLORS['ACCENT'],
+            batch=self.dynamic_batch
         )
         
         self.mode_label = pyglet.text.Label(
@@ -87,8 +117,37 @@ class RainbowWaveDemo(pyglet.window.Window):
             font_name='Arial',
             font_size=12,
             x=20, y=30,
-            color=COLORS['GREEN']
+            color=COLORS['GREEN'],
+            batch=self.dynamic_batch
+        )
+        
+        # 活跃效果计数标签只在数字变化时更新文本
+        sidebar_x = self.board_x + GAME_WIDTH + BORDER_WIDTH
+        self.active_label = pyglet.text.Label(
+            '',
+            font_name='Arial',
+            font_size=12,
+            x=sidebar_x + 20, y=self.height - 150,
+            color=COLORS['ACCENT'],
+            batch=self.dynamic_batch
         )
+        self._last_active_text = None
+        
+        # 效果详情标签池，文本变化时才更新
+        stats_y = self.height - 120
+        details_y = stats_y - 60
+        self.detail_labels = [
+            pyglet.text.Label(
+                '',
+                font_name='Arial',
+                font_size=10,
+                x=sidebar_x + 30, y=details_y - i * 20,
+                color=COLORS['TEXT'],
+                batch=self.dynamic_batch
+            )
+            for i in range(self.MAX_DETAIL_LABELS)
+        ]
+        self._detail_texts = [''] * self.MAX_DETAIL_LABELS
     
     def trigger_rainbow_wave(self, line_y=None):
         """触发彩虹波浪效果
@@ -100,12 +159,12 @@ class RainbowWaveDemo(pyglet.window.Window):
             line_y = random.randint(2, BOARD_HEIGHT - 3)
         
         # 创建RainbowWaveEffect
-        effect = RainbowWaveEffect(line_y, self.board_x, self.board_y)
-        self.effects_manager.line_effects.append(effect)
+        self.effects_manager.add_line_clear_effect_at_position(line_y, self.board_x, self.board_y)
         
         self.status_label.text = f'彩虹波浪效果已触发 - 行 {line_y}'
         
-        print(f"Rainbow wave effect triggered at line {line_y}")
+        if DEBUG:
+            print(f"Rainbow wave effect triggered at line {line_y}")
     
     def on_key_press(self, symbol, modifiers):
         """处理按键事件"""
@@ -117,129 +176,109 @@ class RainbowWaveDemo(pyglet.window.Window):
             color = COLORS['GREEN'] if self.auto_demo else COLORS['RED']
             self.mode_label.text = f'自动模式: {mode_text}'
             self.mode_label.color = color
-            print(f"Auto demo mode: {'ON' if self.auto_demo else 'OFF'}")
+            if DEBUG:
+                print(f"Auto demo mode: {'ON' if self.auto_demo else 'OFF'}")
         elif symbol == pyglet.window.key.C:
             self.effects_manager.clear_all_effects()
             self.status_label.text = '所有效果已清除'
-            print("All effects cleared")
+            if DEBUG:
+                print("All effects cleared")
         elif symbol == pyglet.window.key.ESCAPE:
             self.close()
     
-    def draw_game_board(self):
-        """绘制游戏板背景和网格"""
-        # 绘制游戏板背景
-        board_bg = pyglet.shapes.Rectangle(
+    def create_board_elements(self):
+        """创建游戏板背景、网格和行号（只创建一次）"""
+        # 按原绘制顺序分层：背景 -> 边框 -> 网格线 -> 文字
+        self.bg_group = pyglet.graphics.Group(order=0)
+        self.border_group = pyglet.graphics.Group(order=1)
+        self.line_group = pyglet.graphics.Group(order=2)
+        self.label_group = pyglet.graphics.Group(order=3)
+        self._board_shapes = []
+        
+        # 游戏板背景
+        self._board_shapes.append(pyglet.shapes.Rectangle(
             self.board_x, self.board_y,
             GAME_WIDTH, GAME_HEIGHT,
-            color=COLORS['WHITE'][:3]
-        )
-        board_bg.draw()
+            color=COLORS['WHITE'][:3],
+            batch=self.static_batch, group=self.bg_group
+        ))
         
-        # 绘制游戏板边框
-        border = pyglet.shapes.Rectangle(
+        # 游戏板边框
+        self._board_shapes.append(pyglet.shapes.Rectangle(
             self.board_x - BORDER_WIDTH, self.board_y - BORDER_WIDTH,
             GAME_WIDTH + BORDER_WIDTH * 2, GAME_HEIGHT + BORDER_WIDTH * 2,
-            color=COLORS['BORDER'][:3]
-        )
-        border.draw()
+            color=COLORS['BORDER'][:3],
+            batch=self.static_batch, group=self.border_group
+        ))
         
-        # 绘制网格线
+        # 网格线
         grid_color = (220, 220, 220)
         
         # 垂直线
         for x in range(BOARD_WIDTH + 1):
             line_x = self.board_x + x * CELL_SIZE
-            line = pyglet.shapes.Line(
+            self._board_shapes.append(pyglet.shapes.Line(
                 line_x, self.board_y,
                 line_x, self.board_y + GAME_HEIGHT,
-                color=grid_color
-            )
-            line.draw()
+                color=grid_color,
+                batch=self.static_batch, group=self.line_group
+            ))
         
         # 水平线
         for y in range(BOARD_HEIGHT + 1):
             line_y = self.board_y + y * CELL_SIZE
-            line = pyglet.shapes.Line(
+            self._board_shapes.append(pyglet.shapes.Line(
                 self.board_x, line_y,
                 self.board_x + GAME_WIDTH, line_y,
-                color=grid_color
-            )
-            line.draw()
+                color=grid_color,
+                batch=self.static_batch, group=self.line_group
+            ))
         
-        # 绘制行号标识
+        # 行号标识
         for y in range(BOARD_HEIGHT):
             line_y = self.board_y + (BOARD_HEIGHT - 1 - y) * CELL_SIZE + CELL_SIZE // 2
-            line_label = pyglet.text.Label(
+            self._board_shapes.append(pyglet.text.Label(
                 str(y),
                 font_name='Arial',
                 font_size=10,
                 x=self.board_x - 20, y=line_y,
                 anchor_x='center', anchor_y='center',
-                color=(150, 150, 150, 255)
-            )
-            line_label.draw()
+                color=(150, 150, 150, 255),
+                batch=self.static_batch, group=self.label_group
+            ))
     
-    def draw_sidebar(self):
-        """绘制侧边栏信息"""
+    def create_sidebar_elements(self):
+        """创建侧边栏背景、标题和说明文字（只创建一次）"""
         sidebar_x = self.board_x + GAME_WIDTH + BORDER_WIDTH
+        self._sidebar_labels = []
         
         # 侧边栏背景
-        sidebar_bg = pyglet.shapes.Rectangle(
+        self.sidebar_bg = pyglet.shapes.Rectangle(
             sidebar_x, 0,
             SIDEBAR_WIDTH, self.height,
-            color=COLORS['SIDEBAR'][:3]
+            color=COLORS['SIDEBAR'][:3],
+            batch=self.static_batch, group=self.bg_group
         )
-        sidebar_bg.draw()
         
-        # 效果统计信息
-        active_effects = len(self.effects_manager.line_effects)
-        stats_y = self.height - 120
-        
-        stats_title = pyglet.text.Label(
+        self._sidebar_labels.append(pyglet.text.Label(
             '效果统计',
             font_name='Arial',
             font_size=16,
-            x=sidebar_x + 20, y=stats_y,
-            color=COLORS['TEXT']
-        )
-        stats_title.draw()
-        
-        active_label = pyglet.text.Label(
-            f'活跃效果: {active_effects}',
-            font_name='Arial',
-            font_size=12,
-            x=sidebar_x + 20, y=stats_y - 30,
-            color=COLORS['ACCENT']
-        )
-        active_label.draw()
-        
-        # 效果详情
-        if active_effects > 0:
-            details_y = stats_y - 60
-            for i, effect in enumerate(self.effects_manager.line_effects):
-                if i >= 5:  # 最多显示5个效果
-                    break
-                progress_percent = int(effect.progress * 100)
-                detail_text = f'行{effect.line_y}: {progress_percent}%'
-                detail_label = pyglet.text.Label(
-                    detail_text,
-                    font_name='Arial',
-                    font_size=10,
-                    x=sidebar_x + 30, y=details_y - i * 20,
-                    color=COLORS['TEXT']
-                )
-                detail_label.draw()
+            x=sidebar_x + 20, y=self.height - 120,
+            color=COLORS['TEXT'],
+            batch=self.static_batch, group=self.label_group
+        ))
         
         # 演示说明
         demo_y = 200
-        demo_title = pyglet.text.Label(
+        self._sidebar_labels.append(pyglet.text.Label(
             '演示说明',
             font_name='Arial',
             font_size=16,
             x=sidebar_x + 20, y=demo_y,
-            color=COLORS['TEXT']
-        )
-        demo_title.draw()
+            color=COLORS['TEXT'],
+            batch=self.static_batch, group=self.label_group
+        ))
         
         demo_texts = [
             '彩虹波浪效果特点:',
@@ -255,51 +294,70 @@ class RainbowWaveDemo(pyglet.window.Window):
         ]
         
         for i, text in enumerate(demo_texts):
-            text_label = pyglet.text.Label(
+            self._sidebar_labels.append(pyglet.text.Label(
                 text,
                 font_name='Arial',
                 font_size=10,
                 x=sidebar_x + 20, y=demo_y - 30 - i * 18,
-                color=COLORS['TEXT']
-            )
-            text_label.draw()
+                color=COLORS['TEXT'],
+                batch=self.static_batch, group=self.label_group
+            ))
+    
+    def update_sidebar(self):
+        """更新侧边栏统计和效果详情文字"""
+        # 效果统计信息
+        active_text = f'活跃效果: {self.effects_manager.active_count}'
+        if active_text != self._last_active_text:
+            self.active_label.text = active_text
+            self._last_active_text = active_text
+        
+        # 效果详情（最多显示MAX_DETAIL_LABELS个效果）
+        shown = self.effects_manager.line_effects[:self.MAX_DETAIL_LABELS]
+        for i, label in enumerate(self.detail_labels):
+            if i < len(shown):
+                effect = shown[i]
+                detail_text = f'行{effect.line_y}: {int(effect.progress * 100)}%'
+            else:
+                detail_text = ''
+            if detail_text != self._detail_texts[i]:
+                label.text = detail_text
+                self._detail_texts[i] = detail_text
     
     def on_draw(self):
         """绘制窗口内容"""
         self.clear()
+        self.update_sidebar()
         
-        # 设置背景色
-        pyglet.gl.glClearColor(*[c/255.0 for c in COLORS['BACKGROUND']])
-        
-        # 绘制游戏板
-        self.draw_game_board()
-        
-        # 绘制侧边栏
-        self.draw_sidebar()
+        # 游戏板和侧边栏背景
+        self.static_batch.draw()
         
-        # 绘制效果
-        shapes = self.effects_manager.draw(self.effects_manager.batch, self.effects_manager.group)
+        # 绘制效果（保留返回的图形，避免被回收）
+        self._effect_shapes = self.effects_manager.draw(self.effect_batch, self.effect_group)
+        self.effect_batch.draw()
         
-        # 绘制batch中的所有内容
-        self.effects_manager.batch.draw()
-        
-        # 绘制UI标签
-        self.title_label.draw()
-        self.info_label.draw()
-        self.status_label.draw()
-        self.mode_label.draw()
+        # UI标签和侧边栏统计
+        self.dynamic_batch.draw()
     
     def update(self, dt):
         """更新游戏状态"""
-        # 更新效果
-        self.effects_manager.update(dt)
-        
-        # 自动演示模式
-        if self.auto_demo:
-            current_time = time.time()
-            if current_time - self.last_auto_trigger > self.auto_interval:
+        # 按固定步长更新效果
+        self._sim_accum += dt
+        steps = min(int(self._sim_accum / self.SIM_STEP), self.MAX_SIM_STEPS)
+        if steps:
+            self._sim_accum = min(self._sim_accum - steps * self.SIM_STEP, self.SIM_STEP)
+            if self.effects_manager.active_count > self.LOAD_SHED_THRESHOLD:
+                # 负载高时只做一次较粗的更新
+                self.effects_manager.update(steps * self.SIM_STEP)
+            else:
+                for _ in range(steps):
+                    self.effects_manager.update(self.SIM_STEP)
+        
+        # 自动演示模式（用时钟传入的dt累计间隔，不再每帧读取系统时间）
+        self._since_auto_trigger += dt
+        if self.auto_demo and self.effects_manager.active_count < self.MAX_CONCURRENT:
+            if self._since_auto_trigger > self.auto_interval:
                 self.trigger_rainbow_wave()
-                self.last_auto_trigger = current_time
+                self._since_auto_trigger = 0.0
         
         # 更新状态显示
         if not self.effects_manager.has_active_effects() and not self.auto_demo:
@@ -19,33 +19,77 @@ batch = pyglet.graphics.Batch()
 # 动画对象列表
 animated_objects = []
 
-class BouncingBall:
-    """弹跳球类"""
-    def __init__(self, x, y, vx, vy, radius, color):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.radius = radius
-        self.shape = shapes.Circle(x=x, y=y, radius=radius, color=color, batch=batch)
+# 圆形池容量：超出后循环覆盖最旧的槽位
+BALL_POOL_SIZE = 256
+PULSE_POOL_SIZE = 64
+
+class CirclePool:
+    """固定容量的圆形池，预先创建所有圆形并按环形缓冲区复用"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        self._next_idx = 0
+        self.shapes = []
+        for _ in range(capacity):
+            circle = shapes.Circle(x=-100, y=-100, radius=1, color=(0, 0, 0), batch=batch)
+            circle.visible = False
+            self.shapes.append(circle)
         
-    def update(self, dt):
-        # 更新位置
-        self.x += self.vx * dt
-        self.y += self.vy * dt
+    def __len__(self):
+        return self.count
         
-        # 边界碰撞检测
-        if self.x - self.radius <= 0 or self.x + self.radius >= window.width:
-            self.vx = -self.vx
-            self.x = max(self.radius, min(window.width - self.radius, self.x))
-            
-        if self.y - self.radius <= 0 or self.y + self.radius >= window.height:
-            self.vy = -self.vy
-            self.y = max(self.radius, min(window.height - self.radius, self.y))
+    def _claim(self, x, y, radius, color):
+        """取出下一个槽位（池满时覆盖最旧的），返回其索引"""
+        i = self._next_idx
+        self._next_idx = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        shape = self.shapes[i]
+        shape.position = (x, y)
+        shape.radius = radius
+        shape.color = color
+        shape.visible = True
+        return i
+
+class BouncingBalls(CirclePool):
+    """弹跳球集合（每个属性一个列表，一次循环更新全部球）"""
+    def __init__(self, capacity=BALL_POOL_SIZE):
+        super().__init__(capacity)
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.radius = [0] * capacity
+        
+    def add(self, x, y, vx, vy, radius, color):
+        i = self._claim(x, y, radius, color)
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.radius[i] = radius
+        
+    def update(self, dt):
+        width, height = window.width, window.height
+        xs, ys, vxs, vys, radii = self.x, self.y, self.vx, self.vy, self.radius
+        for i in range(self.count):
+            r = radii[i]
+            # 更新位置
+            x = xs[i] + vxs[i] * dt
+            y = ys[i] + vys[i] * dt
             
-        # 更新图形位置
-        self.shape.x = self.x
-        self.shape.y = self.y
+            # 边界碰撞检测
+            if x - r <= 0 or x + r >= width:
+                vxs[i] = -vxs[i]
+                x = max(r, min(width - r, x))
+                
+            if y - r <= 0 or y + r >= height:
+                vys[i] = -vys[i]
+                y = max(r, min(height - r, y))
+                
+            xs[i] = x
+            ys[i] = y
+            # 更新图形位置
+            self.shapes[i].position = (x, y)
 
 class RotatingSquare:
     """旋转方块类"""
@@ -63,26 +107,37 @@ class RotatingSquare:
         intensity = int(128 + 127 * math.sin(self.rotation))
         self.shape.color = (intensity, intensity, 255)
 
-class PulsatingCircle:
-    """脉动圆形类"""
-    def __init__(self, x, y, base_radius, color, pulse_speed):
-        self.x = x
-        self.y = y
-        self.base_radius = base_radius
-        self.pulse_speed = pulse_speed
-        self.time = 0
-        self.shape = shapes.Circle(x=x, y=y, radius=base_radius, color=color, batch=batch)
+class PulsatingCircles(CirclePool):
+    """脉动圆形集合（每个属性一个列表，一次循环更新全部圆形）"""
+    def __init__(self, capacity=PULSE_POOL_SIZE):
+        super().__init__(capacity)
+        self.base_radius = [0] * capacity
+        self.pulse_speed = [0.0] * capacity
+        self.time = [0.0] * capacity
+        
+    def add(self, x, y, base_radius, color, pulse_speed):
+        i = self._claim(x, y, base_radius, color)
+        self.base_radius[i] = base_radius
+        self.pulse_speed[i] = pulse_speed
+        self.time[i] = 0.0
         
     def update(self, dt):
-        self.time += dt
-        # 脉动效果
-        scale = 1 + 0.5 * math.sin(self.pulse_speed * self.time)
-        self.shape.radius = int(self.base_radius * scale)
+        sin = math.sin
+        times, speeds, base_radii = self.time, self.pulse_speed, self.base_radius
+        for i in range(self.count):
+            t = times[i] + dt
+            times[i] = t
+            # 脉动效果
+            scale = 1 + 0.5 * sin(speeds[i] * t)
+            self.shapes[i].radius = int(base_radii[i] * scale)
+
+balls = BouncingBalls()
+pulsating_circles = PulsatingCircles()
 
 # 创建动画对象
 for i in range(5):
     # 创建弹跳球
-    ball = BouncingBall(
+    balls.add(
         x=random.randint(50, window.width-50),
         y=random.randint(50, window.height-50),
         vx=random.randint(-200, 200),
@@ -90,7 +145,6 @@ for i in range(5):
         radius=random.randint(10, 30),
         color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
     )
-    animated_objects.append(ball)
 
 # 创建旋转方块
 for i in range(3):
@@ -105,17 +159,18 @@ for i in range(3):
 
 # 创建脉动圆形
 for i in range(3):
-    circle = PulsatingCircle(
+    pulsating_circles.add(
         x=random.randint(100, window.width-100),
         y=random.randint(100, window.height-100),
         base_radius=random.randint(20, 40),
         color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)),
         pulse_speed=random.uniform(2, 5)
     )
-    animated_objects.append(circle)
 
 # 更新函数
 def update(dt):
+    balls.update(dt)
+    pulsating_circles.update(dt)
     for obj in animated_objects:
         obj.update(dt)
 
@@ -133,7 +188,7 @@ def on_key_press(symbol, modifiers):
         window.close()
     elif symbol == pyglet.window.key.SPACE:
         # 添加新的弹跳球
-        new_ball = BouncingBall(
+        balls.add(
             x=window.width//2,
             y=window.height//2,
             vx=random.randint(-300, 300),
@@ -141,19 +196,17 @@ def on_key_press(symbol, modifiers):
             radius=random.randint(15, 25),
             color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
         )
-        animated_objects.append(new_ball)
-        print(f"添加了新球，当前总数: {len([obj for obj in animated_objects if isinstance(obj, BouncingBall)])}")
+        print(f"添加了新球，当前总数: {len(balls)}")
 
 @window.event
 def on_mouse_press(x, y, button, modifiers):
     # 在鼠标位置添加脉动圆形
-    new_circle = PulsatingCircle(
+    pulsating_circles.add(
         x=x, y=y,
         base_radius=20,
         color=(255, 255, 0),
         pulse_speed=3
     )
-    animated_objects.append(new_circle)
     print(f"在 ({x}, {y}) 添加了脉动圆形")
 
 if __name__ == '__main__':
@@ -6,8 +6,11 @@ Pyglet音频测试示例
 """
 
 import pyglet
+import functools
 import math
-import struct
+import time
+import sys
+from array import array
 from pyglet import shapes
 
 # 创建窗口
@@ -21,43 +24,54 @@ def generate_tone(frequency, duration, sample_rate=22050, amplitude=0.5):
     生成指定频率和持续时间的音调
     """
     frames = int(duration * sample_rate)
-    arr = []
+    # 循环外预先计算相位步长和16位缩放系数
+    step = 2 * math.pi * frequency / sample_rate
+    scale = amplitude * 32767
+    # 正弦递推 sin((n+1)w) = 2cos(w)sin(nw) - sin((n-1)w)，循环内不再调用math.sin
+    coeff = 2 * math.cos(step)
+    prev, cur = -math.sin(step), 0.0
+    buf = array('h', [0]) * frames
     for i in range(frames):
-        # 生成正弦波
-        value = amplitude * math.sin(2 * math.pi * frequency * i / sample_rate)
         # 转换为16位整数
-        packed_value = struct.pack('<h', int(value * 32767))
-        arr.append(packed_value)
-    
-    return b''.join(arr)
-
-# 生成不同频率的音调
-tones = {
-    'C': generate_tone(261.63, 0.5),  # C4
-    'D': generate_tone(293.66, 0.5),  # D4
-    'E': generate_tone(329.63, 0.5),  # E4
-    'F': generate_tone(349.23, 0.5),  # F4
-    'G': generate_tone(392.00, 0.5),  # G4
-    'A': generate_tone(440.00, 0.5),  # A4
-    'B': generate_tone(493.88, 0.5),  # B4
+        buf[i] = int(scale * cur)
+        prev, cur = cur, coeff * cur - prev
+    # AudioData需要小端字节序
+    if sys.byteorder == 'big':
+        buf.byteswap()
+    return buf.tobytes()
+
+# 各音符的频率
+NOTE_FREQUENCIES = {
+    'C': 261.63,  # C4
+    'D': 293.66,  # D4
+    'E': 329.63,  # E4
+    'F': 349.23,  # F4
+    'G': 392.00,  # G4
+    'A': 440.00,  # A4
+    'B': 493.88,  # B4
 }
 
-# 创建音频源
-audio_sources = {}
-for note, tone_data in tones.items():
-    try:
-        # 创建音频源
-        audio_source = pyglet.media.StaticSource(
-            pyglet.media.AudioData(
-                tone_data,
-                channels=1,
-                sample_size=16,
-                sample_rate=22050
-            )
+@functools.lru_cache(maxsize=None)
+def _tone(frequency, duration, sample_rate, amplitude):
+    """生成并缓存音调数据"""
+    return generate_tone(frequency, duration, sample_rate, amplitude)
+
+@functools.lru_cache(maxsize=None)
+def get_audio_source(note):
+    """首次播放时才生成音符的音频源，之后直接复用"""
+    return pyglet.media.StaticSource(
+        pyglet.media.AudioData(
+            _tone(NOTE_FREQUENCIES[note], 0.5, 22050, 0.5),
+            channels=1,
+            sample_size=16,
+            sample_rate=22050
         )
-        audio_sources[note] = audio_source
-    except Exception as e:
-        print(f"创建音频源 {note} 时出错: {e}")
+    )
+
+@functools.lru_cache(maxsize=None)
+def get_player(note):
+    """每个音符复用同一个播放器，避免每次按键都分配新的音频源"""
+    return pyglet.media.Player()
 
 # 创建钢琴键盘界面
 keys = []
@@ -145,12 +159,35 @@ current_note_label = pyglet.text.Label(
     color=(255, 0, 0, 255)
 )
 
+# 高亮中的琴键 -> 恢复原色的时间，由一个定时回调统一处理
+# （只在有高亮时调度，全部恢复后取消）
+highlight_until = {}
+
+def _revert_highlights(dt):
+    """恢复已到期的琴键颜色"""
+    now = time.monotonic()
+    for key_rect in [kr for kr, until in highlight_until.items() if until <= now]:
+        key_rect.color = (255, 255, 255)
+        del highlight_until[key_rect]
+    if not highlight_until:
+        pyglet.clock.unschedule(_revert_highlights)
+
+def highlight_key(key_rect, duration):
+    """高亮琴键，duration秒后恢复原色"""
+    key_rect.color = (255, 255, 0)  # 黄色高亮
+    if not highlight_until:
+        pyglet.clock.schedule_interval(_revert_highlights, 1/60.0)
+    highlight_until[key_rect] = time.monotonic() + duration
+
 def play_note(note):
     """播放指定音符"""
-    if note in audio_sources:
+    if note in NOTE_FREQUENCIES:
         try:
-            player = pyglet.media.Player()
-            player.queue(audio_sources[note])
+            player = get_player(note)
+            # 播放结束后音频源会出队，需要重新排队
+            if player.source is None:
+                player.queue(get_audio_source(note))
+            player.seek(0)
             player.play()
             current_note_label.text = f'正在播放: {note}'
             print(f"播放音符: {note}")
@@ -158,9 +195,8 @@ def play_note(note):
             # 高亮按键
             for key_rect, key_note, x, y, w, h in keys:
                 if key_note == note:
-                    key_rect.color = (255, 255, 0)  # 黄色高亮
                     # 0.1秒后恢复原色
-                    pyglet.clock.schedule_once(lambda dt, kr=key_rect: setattr(kr, 'color', (255, 255, 255)), 0.1)
+                    highlight_key(key_rect, 0.1)
                     break
                     
         except Exception as e:
@@ -171,10 +207,15 @@ def play_note(note):
         current_note_label.text = f'音符 {note} 不可用'
 
 def get_clicked_key(x, y):
-    """获取点击的琴键"""
-    for key_rect, note, kx, ky, kw, kh in keys:
-        if kx <= x <= kx + kw and ky <= y <= ky + kh:
-            return note
+    """获取点击的琴键
+
+    琴键等宽且紧邻排列，直接由坐标算出琴键索引，无需逐个比较
+    """
+    if not start_y <= y <= start_y + key_height:
+        return None
+    index, offset = divmod(x - start_x, key_width)
+    if 0 <= index < len(keys) and offset <= key_width - 2:
+        return keys[int(index)][1]
     return None
 
 @window.event
@@ -221,9 +262,6 @@ if __name__ == '__main__':
     print("- 按键盘字母键 C D E F G A B 播放对应音符")
     print("- 程序使用数学生成的音调")
     
-    if not audio_sources:
-        print("警告: 没有可用的音频源")
-    else:
-        print(f"成功创建了 {len(audio_sources)} 个音频源")
+    print(f"可用音符: {len(NOTE_FREQUENCIES)} 个（音频源在首次播放时生成）")
     
     pyglet.app.run()
\ No newline at end of file
@@ -7,7 +7,8 @@ Pyglet简单音频测试示例
 
 import pyglet
 import math
-import struct
+import sys
+from array import array
 from pyglet import shapes
 
 # 创建窗口
@@ -21,18 +22,21 @@ def generate_beep(frequency=440, duration=0.2, sample_rate=22050):
     生成简单的蜂鸣音
     """
     frames = int(duration * sample_rate)
-    arr = []
+    # 循环外预先计算相位步长和16位缩放系数
+    step = 2 * math.pi * frequency / sample_rate
+    scale = 0.3 * 32767
+    # 正弦递推 sin((n+1)w) = 2cos(w)sin(nw) - sin((n-1)w)，循环内不再调用math.sin
+    coeff = 2 * math.cos(step)
+    prev, cur = -math.sin(step), 0.0
+    buf = array('h', [0]) * frames
     for i in range(frames):
-        # 生成正弦波
-        value = 0.3 * math.sin(2 * math.pi * frequency * i / sample_rate)
-        # 添加衰减效果
-        decay = 1 - (i / frames)
-        value *= decay
-        # 转换为16位整数
-        packed_value = struct.pack('<h', int(value * 32767))
-        arr.append(packed_value)
-    
-    return b''.join(arr)
+        # 添加线性衰减效果并转换为16位整数
+        buf[i] = int(scale * cur * (1 - i / frames))
+        prev, cur = cur, coeff * cur - prev
+    # AudioData需要小端字节序
+    if sys.byteorder == 'big':
+        buf.byteswap()
+    return buf.tobytes()
 
 # 创建音频源
 try:
@@ -57,14 +61,17 @@ status_circle = shapes.Circle(x=300, y=150, radius=20, color=(255, 0, 0), batch=
 
 # 播放状态
 is_playing = False
-player = None
+# 复用同一个播放器，避免每次播放都分配新的音频源
+player = pyglet.media.Player()
 
 def play_beep():
-    global is_playing, player
+    global is_playing
     if audio_available and not is_playing:
         try:
-            player = pyglet.media.Player()
-            player.queue(audio_source)
+            # 播放结束后音频源会出队，需要重新排队
+            if player.source is None:
+                player.queue(audio_source)
+            player.seek(0)
             player.play()
             is_playing = True
             status_circle.color = (0, 255, 0)  # 绿色表示播放
@@ -6,6 +6,8 @@ Pyglet简单测试示例
 """
 
 import pyglet
+from math import sin
+from random import randint
 from pyglet import shapes
 
 # 创建窗口
@@ -21,17 +23,21 @@ line = shapes.Line(100, 100, 700, 500, width=5, color=(255, 255, 0), batch=batch
 
 # 颜色变化变量
 color_time = 0
+_last_color = None  # 上一次设置的圆形颜色
 
 def update(dt):
-    global color_time
+    global color_time, _last_color
     color_time += dt
     
     # 让圆形颜色变化
-    import math
-    red = int(128 + 127 * math.sin(color_time))
-    green = int(128 + 127 * math.sin(color_time + 2))
-    blue = int(128 + 127 * math.sin(color_time + 4))
-    circle.color = (red, green, blue)
+    red = int(128 + 127 * sin(color_time))
+    green = int(128 + 127 * sin(color_time + 2))
+    blue = int(128 + 127 * sin(color_time + 4))
+    new_color = (red, green, blue)
+    # 8位颜色没有变化时跳过设置，避免重复更新顶点数据
+    if new_color != _last_color:
+        circle.color = new_color
+        _last_color = new_color
 
 # 注册更新函数
 pyglet.clock.schedule_interval(update, 1/60.0)
@@ -48,17 +54,15 @@ def on_key_press(symbol, modifiers):
         print("程序退出")
     elif symbol == pyglet.window.key.SPACE:
         # 改变矩形颜色
-        import random
-        rectangle.color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+        rectangle.color = (randint(0, 255), randint(0, 255), randint(0, 255))
         print("矩形颜色已改变")
 
 @window.event
 def on_mouse_press(x, y, button, modifiers):
     # 在鼠标位置创建新圆形
-    import random
     new_circle = shapes.Circle(
         x=x, y=y, radius=20, 
-        color=(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)), 
+        color=(randint(0, 255), randint(0, 255), randint(0, 255)), 
         batch=batch
     )
     print(f"在 ({x}, {y}) 创建了新圆形")
@@ -19,6 +19,10 @@ class TestBoard(unittest.TestCase):
         """Set up test fixtures."""
         self.board = Board()
     
+    def _fill_row(self, y, color, width=BOARD_WIDTH):
+        """Fill the first `width` cells of row y with one slice assignment."""
+        self.board.grid[y][:width] = [color] * width
+    
     def test_board_initialization(self):
         """Test board initialization."""
         self.assertEqual(self.board.width, BOARD_WIDTH)
@@ -82,8 +86,7 @@ class TestBoard(unittest.TestCase):
     def test_get_full_lines_partial(self):
         """Test getting full lines with partially filled rows."""
         # Fill part of bottom row
-        for x in range(5):
-            self.board.grid[19][x] = COLORS['RED']
+        self._fill_row(19, COLORS['RED'], width=5)
         
         full_lines = self.board.get_full_lines()
         self.assertEqual(full_lines, [])
@@ -91,12 +94,10 @@ class TestBoard(unittest.TestCase):
     def test_get_full_lines_complete(self):
         """Test getting full lines with completely filled rows."""
         # Fill bottom row completely
-        for x in range(BOARD_WIDTH):
-            self.board.grid[19][x] = COLORS['RED']
+        self._fill_row(19, COLORS['RED'])
         
         # Fill another row
-        for x in range(BOARD_WIDTH):
-            self.board.grid[17][x] = COLORS['BLUE']
+        self._fill_row(17, COLORS['BLUE'])
         
         full_lines = self.board.get_full_lines()
         self.assertEqual(sorted(full_lines), [17, 19])
@@ -104,8 +105,7 @@ class TestBoard(unittest.TestCase):
     def test_clear_lines_single(self):
         """Test clearing a single line."""
         # Fill bottom row
-        for x in range(BOARD_WIDTH):
-            self.board.grid[19][x] = COLORS['RED']
+        self._fill_row(19, COLORS['RED'])
         
         # Place a block above
         self.board.grid[18][5] = COLORS['BLUE']
@@ -126,9 +126,8 @@ class TestBoard(unittest.TestCase):
     def test_clear_lines_multiple(self):
         """Test clearing multiple lines."""
         # Fill two rows
-        for x in range(BOARD_WIDTH):
-            self.board.grid[19][x] = COLORS['RED']
-            self.board.grid[18][x] = COLORS['GREEN']
+        self._fill_row(19, COLORS['RED'])
+        self._fill_row(18, COLORS['GREEN'])
         
         # Place blocks above
         self.board.grid[17][3] = COLORS['BLUE']
@@ -235,10 +234,11 @@ class TestBoard(unittest.TestCase):
         # Should be able to place piece partially above board
         self.board.place_piece(piece)
         
-        # Only visible parts should be placed
-        visible_blocks = [(x, y) for x, y in piece.get_blocks() if y >= 0]
-        for x, y in visible_blocks:
-            self.assertIsNotNone(self.board.grid[y][x])
+        # Only visible parts should be placed: the I piece's row lands on y=0
+        expected = {(3, 0), (4, 0), (5, 0), (6, 0)}
+        filled = {(x, y) for y, row in enumerate(self.board.grid)
+                  for x, cell in enumerate(row) if cell is not None}
+        self.assertEqual(filled, expected)
 
 
 if __name__ == '__main__':
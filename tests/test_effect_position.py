@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from tetris_pyglet.effects import RainbowWaveEffect
+from _effect_probe import make_effect
 from tetris_pyglet.constants import BOARD_HEIGHT, CELL_SIZE
 
 # Test effect position calculation
@@ -22,7 +18,7 @@ test_cases = [
 
 for line_y, board_x, board_y in test_cases:
     print(f"\nCreating effect for line_y={line_y}, board_x={board_x}, board_y={board_y}")
-    effect = RainbowWaveEffect(line_y, board_x, board_y)
+    effect = make_effect(line_y, board_x, board_y)
     print(f"Calculated pixel_y: {effect.pixel_y}")
     
     # Manual calculation for verification
@@ -8,7 +8,6 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pyglet
-import time
 from tetris_pyglet.pyglet_game import PygletTetrisGame
 from tetris_pyglet.effects import PygletEffectsManager
 from tetris_pyglet.renderer import PygletRenderer
@@ -20,11 +19,21 @@ class EffectsTestGame(PygletTetrisGame):
         super().__init__()
         self.test_timer = 0.0
         self.test_triggered = False
-        self.game_start_time = time.time()
+        
+    def reset_game(self):
+        super().reset_game()
+        # 用update的dt累计游戏时间，整秒数只在变化时更新
+        self._elapsed = 0.0
+        self._last_game_second = 0
         
     def update(self, dt):
         super().update(dt)
         
+        self._elapsed += dt
+        game_second = int(self._elapsed)
+        if game_second != self._last_game_second:
+            self._last_game_second = game_second
+        
         # 3秒后自动触发特效测试
         self.test_timer += dt
         if self.test_timer > 3.0 and not self.test_triggered:
@@ -45,32 +54,34 @@ class EffectsTestGame(PygletTetrisGame):
             
     def draw(self):
         """重写draw方法以添加更多调试信息"""
-        self.renderer.clear()
-        self.renderer.clear_effect_batch()
+        r = self.renderer
+        current_piece = self.current_piece
+        show_pieces = not self.pending_line_clear
+
+        r.clear()
 
         # Draw board and pieces first
-        self.renderer.draw_board(self.board)
-        if self.ghost_piece and not self.pending_line_clear:
-            self.renderer.draw_piece(self.ghost_piece, ghost=True)
-        if self.current_piece and not self.pending_line_clear:
-            self.renderer.draw_piece(self.current_piece)
+        r.draw_board(self.board)
+        if self.ghost_piece and show_pieces:
+            r.draw_piece(self.ghost_piece, ghost=True)
+        if current_piece and show_pieces:
+            r.draw_piece(current_piece)
 
         # Draw effects ON TOP of board and pieces
-        self.effects_manager.draw(self.renderer.effect_batch, self.renderer.effect_group)
+        r.draw_effects(self.effects_manager)
 
         # Draw UI
-        game_time = int(time.time() - self.game_start_time) if hasattr(self, 'game_start_time') else 0
-        self.renderer.draw_ui(self.score, self.level, self.lines_cleared, self.next_piece, 
-                             self.current_piece, game_time)
+        r.draw_ui(self.score, self.level, self.lines_cleared, self.next_piece,
+                  current_piece, self._last_game_second)
 
         # Draw overlays
         if self.game_over:
-            self.renderer.draw_game_over(self.score)
+            r.draw_game_over(self.score)
         if self.paused and not self.game_over:
-            self.renderer.draw_pause_screen()
+            r.draw_pause_screen()
 
         # Render all batches
-        self.renderer.draw()
+        r.draw()
 
 def main():
     """主函数"""
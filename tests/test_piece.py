@@ -1,5 +1,6 @@
 """Unit tests for the Piece class."""
 
+import functools
 import unittest
 import sys
 import os
@@ -10,13 +11,30 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from tetris.piece import Piece
 from tetris.constants import PIECE_COLORS
 
+# The seven standard tetrominoes, listed explicitly so a missing shape is caught
+_PIECE_TYPES = ('I', 'O', 'T', 'S', 'Z', 'J', 'L')
+
+# Cells of an O piece at the origin (a 2x2 square)
+_O_BLOCKS = ((1, 1), (2, 1), (1, 2), (2, 2))
+
+
+@functools.lru_cache(maxsize=16)
+def _piece(piece_type):
+    """Return a shared default-position piece of the given type (read-only)."""
+    return Piece(piece_type)
+
 
 class TestPiece(unittest.TestCase):
     """Test cases for the Piece class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.piece = Piece('T', 5, 10)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests.
+        
+        The tests only read self.piece; rotate() and move() return new pieces.
+        """
+        cls.shape_keys = frozenset(Piece.SHAPES)
+        cls.piece = Piece('T', 5, 10)
     
     def test_piece_initialization(self):
         """Test piece initialization."""
@@ -29,15 +47,15 @@ class TestPiece(unittest.TestCase):
     def test_random_piece_creation(self):
         """Test creating a random piece."""
         piece = Piece()
-        self.assertIn(piece.type, Piece.SHAPES.keys())
+        self.assertIn(piece.type, self.shape_keys)
         self.assertEqual(piece.x, 3)
         self.assertEqual(piece.y, 0)
         self.assertEqual(piece.rotation, 0)
     
     def test_piece_shapes(self):
         """Test that all piece types have valid shapes."""
-        for piece_type in Piece.SHAPES.keys():
-            piece = Piece(piece_type)
+        for piece_type in Piece.SHAPES:
+            piece = _piece(piece_type)
             self.assertIsInstance(piece.shape, list)
             self.assertEqual(len(piece.shape), 4)
             for row in piece.shape:
@@ -48,10 +66,15 @@ class TestPiece(unittest.TestCase):
     def test_get_blocks(self):
         """Test getting block positions."""
         piece = Piece('O', 0, 0)  # 2x2 square
-        blocks = piece.get_blocks()
-        expected_blocks = [(1, 1), (2, 1), (1, 2), (2, 2)]
-        self.assertEqual(sorted(blocks), sorted(expected_blocks))
-    
+        self.assertCountEqual(piece.get_blocks(), _O_BLOCKS)
+
+    def test_visible_blocks(self):
+        """Test filtering out blocks above a given row."""
+        piece = Piece('O', 0, -2)  # Blocks on rows -1 and 0
+        self.assertCountEqual(piece.visible_blocks(), [(1, 0), (2, 0)])
+        self.assertCountEqual(piece.visible_blocks(min_y=-1), piece.get_blocks())
+        self.assertEqual(piece.visible_blocks(min_y=1), [])
+
     def test_piece_rotation(self):
         """Test piece rotation."""
         original_rotation = self.piece.rotation
@@ -104,7 +127,7 @@ class TestPiece(unittest.TestCase):
         rotated_piece = o_piece.rotate()
         rotated_blocks = rotated_piece.get_blocks()
         
-        self.assertEqual(sorted(original_blocks), sorted(rotated_blocks))
+        self.assertCountEqual(original_blocks, rotated_blocks)
     
     def test_i_piece_rotation(self):
         """Test I piece rotation (horizontal to vertical)."""
@@ -115,7 +138,7 @@ class TestPiece(unittest.TestCase):
         rotated_blocks = rotated_piece.get_blocks()
         
         # Should have different block positions
-        self.assertNotEqual(sorted(original_blocks), sorted(rotated_blocks))
+        self.assertNotEqual(set(original_blocks), set(rotated_blocks))
         
         # Should have same number of blocks
         self.assertEqual(len(original_blocks), len(rotated_blocks))
@@ -123,25 +146,25 @@ class TestPiece(unittest.TestCase):
     def test_get_random_type(self):
         """Test getting random piece type."""
         piece_type = Piece.get_random_type()
-        self.assertIn(piece_type, Piece.SHAPES.keys())
+        self.assertIn(piece_type, self.shape_keys)
     
     def test_all_piece_types(self):
         """Test that all piece types can be created and have valid properties."""
-        for piece_type in ['I', 'O', 'T', 'S', 'Z', 'J', 'L']:
-            piece = Piece(piece_type)
-            self.assertEqual(piece.type, piece_type)
-            self.assertIn(piece_type, PIECE_COLORS)
-            self.assertEqual(piece.color, PIECE_COLORS[piece_type])
-            
-            # Test that piece has at least one block
-            blocks = piece.get_blocks()
-            self.assertGreater(len(blocks), 0)
-            
-            # Test that all rotations are valid
-            for _ in range(4):  # Test up to 4 rotations
-                piece = piece.rotate()
+        for piece_type in _PIECE_TYPES:
+            with self.subTest(piece_type=piece_type):
+                piece = _piece(piece_type)
+                self.assertEqual(piece.type, piece_type)
+                self.assertEqual(piece.color, PIECE_COLORS[piece_type])
+                
+                # Test that piece has at least one block
                 blocks = piece.get_blocks()
                 self.assertGreater(len(blocks), 0)
+                
+                # Test that all rotations are valid
+                for _ in range(len(Piece.SHAPES[piece_type])):  # One full rotation cycle
+                    piece = piece.rotate()
+                    blocks = piece.get_blocks()
+                    self.assertGreater(len(blocks), 0)
 
 
 if __name__ == '__main__':
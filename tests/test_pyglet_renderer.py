@@ -0,0 +1,70 @@
+"""Unit tests for the static layers drawn by PygletRenderer.
+
+The tests need an OpenGL window and are skipped without one; on machines
+without a display, run them offscreen with PYGLET_HEADLESS=1.
+"""
+
+import unittest
+
+import pyglet
+
+
+class TestRendererStaticLayers(unittest.TestCase):
+    """Pixel checks on a frame holding only the static elements."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Render one frame of the static elements and read it back."""
+        try:
+            from tetris_pyglet.constants import WINDOW_WIDTH, WINDOW_HEIGHT
+            from tetris_pyglet.renderer import PygletRenderer
+            cls.window = pyglet.window.Window(WINDOW_WIDTH, WINDOW_HEIGHT, visible=False)
+        except Exception as e:
+            raise unittest.SkipTest(f"no OpenGL window available: {e}")
+        cls.renderer = PygletRenderer(cls.window)
+        cls.window.switch_to()
+        cls.window.clear()
+        cls.renderer.draw()
+        buffer = pyglet.image.get_buffer_manager().get_color_buffer()
+        cls.image = buffer.get_image_data()
+        cls.pixels = cls.image.get_data('RGB', cls.image.width * 3)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the window."""
+        cls.window.close()
+
+    def _pixel(self, x, y):
+        """Return the RGB pixel at window coordinates (x, y)."""
+        i = (y * self.image.width + x) * 3
+        return tuple(self.pixels[i:i + 3])
+
+    def assertColorClose(self, actual, expected, tolerance=8):
+        """Assert two RGB colors match within the framebuffer's precision."""
+        for a, e in zip(actual, expected):
+            self.assertLessEqual(abs(a - e), tolerance, f"{actual} != {expected}")
+
+    def test_board_background_drawn_over_border(self):
+        """Test that the border only shows as a frame around the board."""
+        from tetris_pyglet.constants import CELL_SIZE, COLORS
+        r = self.renderer
+        inside = (r.board_x + CELL_SIZE // 2, r.board_y + CELL_SIZE // 2)
+        self.assertColorClose(self._pixel(*inside), COLORS['WHITE'][:3])
+        self.assertColorClose(self._pixel(r.board_x - 1, inside[1]), COLORS['BORDER'][:3])
+
+    def test_controls_follow_shown_sections(self):
+        """Test that the controls move up when optional sections are hidden."""
+        from tetris_pyglet.piece import Piece
+        r = self.renderer
+        title = r._static_control_labels[0]
+        r.draw_ui(0, 1, 0, Piece('T'), Piece('I'), 0)
+        full_y = title.y
+        r.draw_ui(0, 1, 0)
+        hidden = (r._NEXT_SECTION_HEIGHT + r._CURRENT_SECTION_HEIGHT
+                  + r._TIME_SECTION_HEIGHT)
+        self.assertEqual(title.y, full_y + hidden)
+        self.assertEqual(r._static_control_labels[-1].y, title.y - 25 - 20 * (len(r._CONTROLS) - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
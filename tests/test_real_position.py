@@ -1,10 +1,5 @@
 #!/usr/bin/env python3
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from tetris_pyglet.effects import RainbowWaveEffect
 from tetris_pyglet.constants import BOARD_HEIGHT, CELL_SIZE, BORDER_WIDTH, WINDOW_HEIGHT
 
 # Test with real game values
@@ -22,16 +17,18 @@ board_x = BORDER_WIDTH
 board_y = BORDER_WIDTH
 
 print("\n=== Testing line clear effects ===")
-for line_y in [0, 5, 10, 15, 19]:  # Test various lines
+# Same formula RainbowWaveEffect uses for pixel_y; no effect objects needed
+test_lines = [0, 5, 10, 15, 19]  # Test various lines
+pixel_ys = [board_y + (BOARD_HEIGHT - 1 - line_y) * CELL_SIZE for line_y in test_lines]
+for line_y, pixel_y in zip(test_lines, pixel_ys):
     print(f"\nLine {line_y}:")
-    effect = RainbowWaveEffect(line_y, board_x, board_y)
-    print(f"  pixel_y: {effect.pixel_y}")
-    print(f"  Within window (0-{WINDOW_HEIGHT}): {0 <= effect.pixel_y <= WINDOW_HEIGHT}")
+    print(f"  pixel_y: {pixel_y}")
+    print(f"  Within window (0-{WINDOW_HEIGHT}): {0 <= pixel_y <= WINDOW_HEIGHT}")
     
     # Check if effect is visible
-    if effect.pixel_y < 0:
+    if pixel_y < 0:
         print(f"  ❌ Effect is ABOVE the window (negative Y)")
-    elif effect.pixel_y > WINDOW_HEIGHT:
+    elif pixel_y > WINDOW_HEIGHT:
         print(f"  ❌ Effect is BELOW the window (Y > {WINDOW_HEIGHT})")
     else:
         print(f"  ✅ Effect is VISIBLE in window")
@@ -1,122 +1,105 @@
 #!/usr/bin/env python3
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 import pyglet
 from pyglet import shapes
-from tetris_pyglet.effects import RainbowWaveEffect
+from _effect_probe import make_effect
 from tetris_pyglet.constants import (
     BOARD_HEIGHT, CELL_SIZE, BORDER_WIDTH, WINDOW_WIDTH, WINDOW_HEIGHT,
     BOARD_WIDTH, GAME_WIDTH, GAME_HEIGHT
 )
 
+# Board lines that get an effect and a coordinate label
+TEST_LINES = (0, 5, 10, 15, 19)
+
 class EffectVisualizationTest:
     def __init__(self):
         self.window = pyglet.window.Window(WINDOW_WIDTH, WINDOW_HEIGHT, caption="Effect Position Test")
-        self.batch = pyglet.graphics.Batch()
-        self.group = pyglet.graphics.Group()
+        
+        # Guides never change, so they live in their own static batch
+        self.static_batch = pyglet.graphics.Batch()
+        self.static_group = pyglet.graphics.Group()
+        self.guide_shapes = []
         
         # Board position (same as in real game)
         self.board_x = BORDER_WIDTH
         self.board_y = BORDER_WIDTH
         
-        # Create effects for different lines
-        self.effects = []
-        for line_y in [0, 5, 10, 15, 19]:  # Test various lines
-            effect = RainbowWaveEffect(line_y, self.board_x, self.board_y)
-            self.effects.append((line_y, effect))
+        # Create effects for different lines, drawn into a persistent batch
+        self.effect_objs = [make_effect(line_y, self.board_x, self.board_y)
+                            for line_y in TEST_LINES]
+        self.effect_batch = pyglet.graphics.Batch()
+        self.effect_group = pyglet.graphics.Group()
+        self.effect_shapes = []
         
         # Create visual guides
         self.create_visual_guides()
         
-        # Event handlers
-        @self.window.event
-        def on_draw():
-            self.window.clear()
-            
-            # Draw visual guides
-            self.batch.draw()
-            
-            # Draw effects
-            for line_y, effect in self.effects:
-                effect_shapes = effect.draw(self.batch, self.group)
-                print(f"Line {line_y}: Drew {len(effect_shapes)} shapes at pixel_y={effect.pixel_y}")
-        
-        @self.window.event
-        def on_key_press(symbol, modifiers):
-            if symbol == pyglet.window.key.ESCAPE:
-                self.window.close()
+        # No on_key_press handler: ESC closes via pyglet's default handler
     
     def create_visual_guides(self):
         """Create visual guides to show board boundaries and coordinate system."""
         # Draw board outline
         board_outline = shapes.Rectangle(
             self.board_x, self.board_y, GAME_WIDTH, GAME_HEIGHT,
-            color=(200, 200, 200), batch=self.batch, group=self.group
+            color=(200, 200, 200), batch=self.static_batch, group=self.static_group
         )
         board_outline.opacity = 100
+        self.guide_shapes.append(board_outline)
         
-        # Draw horizontal lines for each row
+        # Draw horizontal lines for each row; keep references so they are not collected
         for y in range(BOARD_HEIGHT + 1):
             line_y = self.board_y + y * CELL_SIZE
-            line = shapes.Line(
+            self.guide_shapes.append(shapes.Line(
                 self.board_x, line_y,
                 self.board_x + GAME_WIDTH, line_y,
-                color=(150, 150, 150), batch=self.batch, group=self.group
-            )
+                color=(150, 150, 150), batch=self.static_batch, group=self.static_group
+            ))
         
         # Draw coordinate labels
-        self.labels = []
-        for line_y in [0, 5, 10, 15, 19]:
-            pixel_y = self.board_y + (BOARD_HEIGHT - 1 - line_y) * CELL_SIZE
-            label = pyglet.text.Label(
+        pixel_ys = tuple(self.board_y + (BOARD_HEIGHT - 1 - line_y) * CELL_SIZE for line_y in TEST_LINES)
+        label_x = self.board_x + GAME_WIDTH + 10
+        self.labels = [
+            pyglet.text.Label(
                 f'Line {line_y}',
                 font_name='Arial', font_size=12,
-                x=self.board_x + GAME_WIDTH + 10, y=pixel_y,
-                anchor_x='left', anchor_y='center'
+                x=label_x, y=pixel_y,
+                anchor_x='left', anchor_y='center',
+                batch=self.static_batch, group=self.static_group
             )
-            self.labels.append(label)
+            for line_y, pixel_y in zip(TEST_LINES, pixel_ys)
+        ]
         
         # Window info label
         self.info_label = pyglet.text.Label(
             f'Window: {WINDOW_WIDTH}x{WINDOW_HEIGHT}, Board: {self.board_x},{self.board_y} to {self.board_x+GAME_WIDTH},{self.board_y+GAME_HEIGHT}',
             font_name='Arial', font_size=10,
             x=10, y=WINDOW_HEIGHT - 20,
-            anchor_x='left', anchor_y='top'
+            anchor_x='left', anchor_y='top',
+            batch=self.static_batch, group=self.static_group
         )
     
     def update(self, dt):
-        # Update effects
-        for line_y, effect in self.effects:
+        # Update effects once per tick; draw() moves each effect's pooled
+        # shapes in place (they are created on the first call only)
+        effect_shapes = []
+        for effect in self.effect_objs:
             effect.update(dt)
+            effect_shapes.extend(effect.draw(self.effect_batch, self.effect_group))
+        self.effect_shapes = effect_shapes
     
     def run(self):
         # Schedule update
         pyglet.clock.schedule_interval(self.update, 1/60.0)
         
-        # Draw labels separately (not in batch)
         @self.window.event
         def on_draw():
             self.window.clear()
             
-            # Draw visual guides
-            self.batch.draw()
-            
-            # Draw effects
-            effect_batch = pyglet.graphics.Batch()
-            effect_group = pyglet.graphics.Group()
-            
-            for line_y, effect in self.effects:
-                effect_shapes = effect.draw(effect_batch, effect_group)
-            
-            effect_batch.draw()
+            # Draw visual guides and labels
+            self.static_batch.draw()
             
-            # Draw labels
-            for label in self.labels:
-                label.draw()
-            self.info_label.draw()
+            # Draw effects (their pooled shapes are updated in update)
+            self.effect_batch.draw()
         
         print("Starting effect visualization test...")
         print("Press ESC to exit")